@@ -6,24 +6,66 @@ get_session()
     Yield a database session for the app.
 get_current_admin()
     Return the admin currently authenticated.
+get_event_service()
+    Return the event service of the request.
+get_link_service()
+    Return the user-event link service of the request.
+get_message_service()
+    Return the message service of the request.
+get_friendship_service()
+    Return the friendship service of the request.
+get_creator_link(event_id)
+    Return the link of the current user, who must be the event creator.
+get_participant_link(event_id)
+    Return the link of the current user, who must take part in the event.
 """
 from fastapi import Depends, Header, HTTPException
-from jose import JWTError, jwt
+import jwt
 from sqlmodel import Session
 
-from app.configs.database_setup import engine
-from app.configs.settings import AuthSettings
+from app.configs.database_setup import session_factory
+from app.models.enums import PARTICIPANT_STATUSES, UserEventStatus
+from app.models.links import UserEventLink
 from app.models.tokens import TokenData
 from app.models.users import User
+from app.services.event_services import EventService
+from app.services.friendship_services import FriendshipService
+from app.services.link_user_event_services import UserEventLinkService
+from app.services.message_services import MessageService
 from app.services.user_services import UserService
+from app.utils.token_utils import ALGORITHM, SECRET_KEY
 
 
 def get_session():
     """Yield session for the whole app."""
-    with Session(engine) as session:
+    with session_factory() as session:
         yield session
 
 
+def get_event_service(session: Session = Depends(get_session)
+                      ) -> EventService:
+    """Get the event service, built once per request."""
+    return EventService(session)
+
+
+def get_link_service(session: Session = Depends(get_session)
+                     ) -> UserEventLinkService:
+    """Get the user-event link service, built once per request."""
+    return UserEventLinkService(session)
+
+
+def get_message_service(session: Session = Depends(get_session)
+                        ) -> MessageService:
+    """Get the message service, built once per request."""
+    return MessageService(session)
+
+
+def get_friendship_service(session: Session = Depends(get_session)
+                           ) -> FriendshipService:
+    """Get the friendship service, built once per request."""
+    return FriendshipService(session)
+
+
 def get_current_user(token: str = Header(...),
                      session: Session = Depends(get_session)) -> User:
     """Get the user currently authenticated.
@@ -48,14 +90,79 @@ def get_current_user(token: str = Header(...),
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"})
     try:
-        payload = jwt.decode(token=token,
-                             key=AuthSettings().key,
-                             algorithms=[AuthSettings().algo])
+        payload = jwt.decode(token,
+                             key=SECRET_KEY,
+                             algorithms=[ALGORITHM])
         phone: str = payload.get("sub")
         if phone is None:
             raise credentials_exception
         auth_data = TokenData(phone=phone)
-    except JWTError as exc:  # TODO : validation error
+    except jwt.PyJWTError as exc:  # TODO : validation error
         raise credentials_exception from exc
     user = UserService(session).read_user_by_phone(auth_data.phone)
     return user
+
+
+def get_creator_link(event_id: int,
+                     current_user: User = Depends(get_current_user),
+                     link_service: UserEventLinkService = Depends(
+                         get_link_service)) -> UserEventLink:
+    """Get the link between the current user and the event they created.
+
+    Parameters
+    ----------
+    event_id : int
+        The id of the event.
+    current_user : User
+        The user currently authenticated.
+    link_service : UserEventLinkService
+        The user-event link service of the request.
+
+    Returns
+    -------
+    UserEventLink
+        The link between the current user and the event.
+
+    Raises
+    ------
+    HTTPException
+        Raised when the current user did not create the event.
+    """
+    link = link_service.read_user_event_link(current_user.id, event_id)
+    if link.status != UserEventStatus.CREATOR:
+        raise HTTPException(status_code=401,
+                            detail="Only creator of the event is authorized.")
+    return link
+
+
+def get_participant_link(event_id: int,
+                         current_user: User = Depends(get_current_user),
+                         link_service: UserEventLinkService = Depends(
+                             get_link_service)) -> UserEventLink:
+    """Get the link between the current user and an event they take part in.
+
+    Parameters
+    ----------
+    event_id : int
+        The id of the event.
+    current_user : User
+        The user currently authenticated.
+    link_service : UserEventLinkService
+        The user-event link service of the request.
+
+    Returns
+    -------
+    UserEventLink
+        The link between the current user and the event.
+
+    Raises
+    ------
+    HTTPException
+        Raised when the current user neither created nor attends the event.
+    """
+    link = link_service.read_user_event_link(current_user.id, event_id)
+    if link.status not in PARTICIPANT_STATUSES:
+        raise HTTPException(
+            status_code=401,
+            detail=f"Current user isn't allowed in event {event_id}")
+    return link
@@ -3,18 +3,22 @@ Title, include all routers, etc.
 """
 from enum import Enum
 
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
-from app.configs.database_setup import create_db_and_tables
-from app.configs.settings import StaticSettings
+from app.configs.database_setup import create_db_and_tables, engine
+from app.configs.database_setup import settings as db_settings
+from app.configs.settings import get_static_settings
 from app.routers import (authentication_router,
                          event_base_router,
                          event_creator_router,
                          event_participant_router,
                          friendship_router,
                          user_router)
+from app.utils.verify_code_utils import close_verify_client
 
 
 class Tags(Enum):
@@ -63,7 +67,8 @@ app = FastAPI(
     title="Connect",
     version="0.0.1",
     description="Share moments",
-    openapi_tags=tags_metadata
+    openapi_tags=tags_metadata,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -79,10 +84,31 @@ app.add_middleware(
 def on_startup():
     """Actions to perform when starting the app."""
     create_db_and_tables()
+    # Sync endpoints run in anyio's thread pool, 40 threads by default. Allow
+    # no more of them than the database pool can serve at once, so that
+    # requests queue for a thread instead of timing out on a connection.
+    to_thread.current_default_thread_limiter().total_tokens = (
+        db_settings.pool_size + db_settings.max_overflow)
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """Actions to perform when stopping the app."""
+    await close_verify_client()
 
 
 # TODO : redundancies oin shutdown (save the data)
 
+
+@app.get("/health", include_in_schema=False)
+def health():
+    """Report that the app is up, with the state of the connection pool.
+
+    This helps tuning the pool size against real load.
+    """
+    return {"status": "ok", "db_pool": engine.pool.status()}
+
+
 app.include_router(authentication_router.router, tags=[Tags.AUTH])
 app.include_router(user_router.router, tags=[Tags.USER])
 app.include_router(friendship_router.router, tags=[Tags.FRIEND])
@@ -91,11 +117,11 @@ app.include_router(event_participant_router.router, tags=[Tags.EVENT_PART])
 app.include_router(event_creator_router.router, tags=[Tags.EVENT_CRE])
 
 app.mount("/user_page_picture",
-          StaticFiles(directory=StaticSettings().user_page_pic_dir),
+          StaticFiles(directory=get_static_settings().user_page_pic_dir),
           name="user_page_picture")
 app.mount("/event_page_picture",
-          StaticFiles(directory=StaticSettings().event_page_pic_dir),
+          StaticFiles(directory=get_static_settings().event_page_pic_dir),
           name="event_page_picture")
 app.mount("/event_pictures",
-          StaticFiles(directory=StaticSettings().events_dir),
+          StaticFiles(directory=get_static_settings().events_dir),
           name="event_pictures")
@@ -11,7 +11,9 @@ delete_db()
 
 import os
 
-from sqlmodel import SQLModel, create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+from sqlmodel import Session, SQLModel, create_engine
 
 from app.configs.settings import DBSettings
 from app.models.addresses import Address  # noqa: F401
@@ -30,9 +32,19 @@ settings = DBSettings()
 engine = create_engine(
     settings.url,
     echo=settings.echo,
-    connect_args={"check_same_thread": settings.thread}
+    connect_args={"check_same_thread": settings.thread},
+    poolclass=QueuePool,
+    pool_size=settings.pool_size,
+    max_overflow=settings.max_overflow,
+    pool_timeout=settings.pool_timeout,
+    pool_recycle=settings.pool_recycle,
+    pool_pre_ping=settings.pool_pre_ping
 )
 
+# Objects are kept loaded after commit, so that returning them in a response
+# does not trigger a new SELECT for each of them.
+session_factory = sessionmaker(engine, class_=Session, expire_on_commit=False)
+
 
 def create_db_and_tables() -> None:
     """Create database with all tables."""
@@ -9,8 +9,18 @@ Classes
 -------
 DBSettings
     Contains all necessary settings relative to the database.
+
+Functions
+---------
+get_static_settings()
+    Get the settings related to static files, read once.
+get_auth_settings()
+    Get the settings related to authentication, read once.
+get_ext_resources_settings()
+    Get the settings related to external resources, read once.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import BaseSettings, Field
@@ -49,6 +59,19 @@ class DBSettings(_BaseAppSettings):
     thread: bool
         True if we allow multiple requests to use the same session.
         False otherwise.
+    pool_size: int
+        Number of connections kept open in the connection pool.
+    max_overflow: int
+        Number of connections that can be opened beyond pool_size.
+    pool_timeout: int
+        Number of seconds to wait for a connection before giving up.
+    pool_recycle: int
+        Number of seconds after which a connection is replaced.
+    pool_pre_ping: bool
+        True if connections should be tested before being used.
+    strict_loading: bool
+        True if lazy loading a relationship that should have been loaded
+        eagerly must raise an error. From env, False by default.
     """
     path: Path = Field(..., env="PATH_TO_DATABASE")
     saves_dir: Path = Field(..., env="PATH_TO_SAVES_DIR")
@@ -56,6 +79,14 @@ class DBSettings(_BaseAppSettings):
     echo: bool = True
     thread: bool = False
 
+    pool_size: int = 20
+    max_overflow: int = 20
+    pool_timeout: int = 30
+    pool_recycle: int = 300
+    pool_pre_ping: bool = True
+
+    strict_loading: bool = Field(False, env="APP_STRICT_LOADING")
+
     @property
     def url(self) -> str:
         """Get the URL to the database.
@@ -136,3 +167,48 @@ class StaticSettings(_BaseAppSettings):
     user_page_pic_dir: str = "static/images/user_page"
     event_page_pic_dir: str = "static/images/event_page"
     events_dir: str = "static/images/events"
+
+
+@lru_cache(maxsize=1)
+def get_static_settings() -> StaticSettings:
+    """Get the settings related to static files.
+
+    The settings are only read and validated on the first call, later calls
+    return the same instance.
+
+    Returns
+    -------
+    StaticSettings
+        The settings related to static files.
+    """
+    return StaticSettings()
+
+
+@lru_cache(maxsize=1)
+def get_auth_settings() -> AuthSettings:
+    """Get the settings related to authentication.
+
+    The settings are only read and validated on the first call, later calls
+    return the same instance.
+
+    Returns
+    -------
+    AuthSettings
+        The settings related to authentication.
+    """
+    return AuthSettings()
+
+
+@lru_cache(maxsize=1)
+def get_ext_resources_settings() -> ExtResourcesSettings:
+    """Get the settings related to external resources.
+
+    The settings are only read and validated on the first call, later calls
+    return the same instance.
+
+    Returns
+    -------
+    ExtResourcesSettings
+        The settings related to external resources.
+    """
+    return ExtResourcesSettings()
@@ -21,7 +21,7 @@ class AuthDao:
 
     Methods
     -------
-    create_auth(self, auth)
+    create_auth(self, auth, commit)
         Add a new auth in database.
     read_auths(self, offset, limit)
         Read auths from database between offset and offset+limit.
@@ -35,13 +35,15 @@ class AuthDao:
     def __init__(self, session: Session):
         self.session = session
 
-    def create_auth(self, auth: Auth) -> Auth:
+    def create_auth(self, auth: Auth, commit: bool = True) -> Auth:
         """Create a new auth in database.
 
         Parameters
         ----------
         auth : Auth
             The auth to add to database.
+        commit : bool, optional
+            False to leave the auth for the caller to commit, by default True.
 
         Returns
         -------
@@ -49,7 +51,8 @@ class AuthDao:
             The created auth.
         """
         self.session.add(auth)
-        self.session.commit()
+        if commit:
+            self.session.commit()
         return auth
 
     def read_auth_by_phone(self, phone: str) -> Auth:
@@ -70,8 +73,7 @@ class AuthDao:
         HTTPException
             Raised when there is no auth with that id.
         """
-        statement = select(Auth).where(Auth.phone == phone)
-        auth = self.session.exec(statement).one_or_none()
+        auth = self.session.get(Auth, phone)
         if auth is None:
             raise HTTPException(status_code=404,
                                 detail=f"Auth {phone} not found.")
@@ -114,8 +116,7 @@ class AuthDao:
         HTTPException
             Raised when there is no auth with that id.
         """
-        statement = select(Auth).where(Auth.phone == phone)
-        auth = self.session.exec(statement).one_or_none()
+        auth = self.session.get(Auth, phone)
         if auth is None:
             raise HTTPException(status_code=404,
                                 detail=f"Auth with id {phone} not found.")
@@ -141,8 +142,7 @@ class AuthDao:
         HTTPException
             Raised when the auth does not exist.
         """
-        statement = select(Auth).where(Auth.phone == phone)
-        old_auth = self.session.exec(statement).one_or_none()
+        old_auth = self.session.get(Auth, phone)
         if old_auth is None:
             raise HTTPException(status_code=404,
                                 detail=f"Auth {phone} not found.")
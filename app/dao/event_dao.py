@@ -4,12 +4,24 @@ Classes
 EventDao(session)
     Data access for events.
 """
-from typing import List
+from datetime import datetime as dttime
+from typing import Any, List, Mapping, Optional, Tuple
 
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlalchemy import select as core_select
+from sqlalchemy.orm import joinedload, raiseload
+from sqlmodel import Session, col, select
 
-from app.models.events import Event, EventUpdate
+from app.configs.database_setup import settings
+from app.models.enums import EventCategory
+from app.models.events import Event, EventRead, EventUpdate
+from app.models.latitudes_longitudes import LatLon
+
+# Relationships read along with events. With strict loading, any other
+# relationship raises when accessed instead of emitting a new SELECT.
+EVENT_LOAD_OPTIONS: List[Any] = [joinedload(Event.latlon)]
+if settings.strict_loading:
+    EVENT_LOAD_OPTIONS.append(raiseload("*"))
 
 
 class EventDao:
@@ -30,6 +42,8 @@ class EventDao:
         Update a event in database with new event data.
     delete_event(self, event_id)
         Delete a event from database using its id.
+    read_event_rows_to_come_in_box(self, now, bounding_box, category)
+        Read events starting after now within bounds, as rows.
     """
     def __init__(self, session: Session):
         self.session = session
@@ -49,12 +63,14 @@ class EventDao:
         """
         self.session.add(event)
         self.session.commit()
-        self.session.refresh(event)
         return event
 
     def read_event(self, event_id: int) -> Event:
         """Read a single event using its id.
 
+        Its coordinates are loaded in the same query, since they are read
+        whenever the event is sent back.
+
         Parameters
         ----------
         event_id : int
@@ -70,7 +86,7 @@ class EventDao:
         HTTPException
             Raised when there is no event with that id.
         """
-        event = self.session.get(Event, event_id)
+        event = self.session.get(Event, event_id, options=EVENT_LOAD_OPTIONS)
         if event is None:
             raise HTTPException(status_code=404,
                                 detail=f"Event with id {event_id} not found.")
@@ -91,7 +107,10 @@ class EventDao:
         List[Event]
             The events read from table.
         """
-        statement = select(Event).offset(offset).limit(limit)
+        statement = (select(Event)
+                     .options(*EVENT_LOAD_OPTIONS)
+                     .offset(offset)
+                     .limit(limit))
         events = self.session.exec(statement).all()
         return events
 
@@ -193,5 +212,44 @@ class EventDao:
         List[Event]
             All events in table.
         """
-        events = self.session.exec(select(Event)).all()
+        statement = select(Event).options(*EVENT_LOAD_OPTIONS)
+        events = self.session.exec(statement).all()
         return events
+
+    def read_event_rows_to_come_in_box(
+            self,
+            now: dttime,
+            bounding_box: Tuple[float, float, float, float],
+            category: Optional[EventCategory] = None
+            ) -> List[Mapping[str, Any]]:
+        """Read the events starting after a given time within bounds.
+
+        Rows are read as plain mappings rather than Event objects, since they
+        are only used to build responses. Events without coordinates are
+        left out.
+
+        Parameters
+        ----------
+        now : datetime
+            The time after which events must start.
+        bounding_box : Tuple[float, float, float, float]
+            The minimum latitude, maximum latitude, minimum longitude and
+            maximum longitude of the events, in degrees.
+        category : Optional[EventCategory], optional
+            The category of events to read, by default None for all of them.
+
+        Returns
+        -------
+        List[Mapping[str, Any]]
+            The events to come, with the EventRead fields and lat, lon.
+        """
+        lat_min, lat_max, lon_min, lon_max = bounding_box
+        columns = [getattr(Event, name) for name in EventRead.__fields__]
+        statement = (core_select(*columns, LatLon.lat, LatLon.lon)
+                     .join(LatLon, LatLon.event_id == Event.id)
+                     .where(Event.start_time > now)
+                     .where(col(LatLon.lat).between(lat_min, lat_max))
+                     .where(col(LatLon.lon).between(lon_min, lon_max)))
+        if category is not None:
+            statement = statement.where(Event.category == category)
+        return self.session.execute(statement).mappings().all()
@@ -5,10 +5,10 @@ Classes
 FrienshipDao(session)
     Data access for friendships.
 """
-from typing import List
+from typing import List, Optional
 
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from app.models.enums import FriendshipStatus
 from app.models.links import Friendship
@@ -26,10 +26,14 @@ class FriendshipDao:
         Create a new friendship.
     read_friendship(sender_id, receiver_id)
         Read a single friendship.
+    read_friendship_or_none(sender_id, receiver_id)
+        Read a single friendship, None if it does not exist.
     get_friendship(user1_id, user2_id)
         Read a single friendship both ways.
     read_friendships(offset, limit)
         Read friendships between offset and offset+limit.
+    read_friendships_among(user_ids)
+        Read friendships between users of a group.
     delete_friendship(sender_id, receiver_id)
         Delete a friendship.
     update_friendship_status(sender_id, receiver_id)
@@ -55,8 +59,9 @@ class FriendshipDao:
                 friendship.invite_receiver_id is None):
             raise HTTPException(status_code=404,
                                 detail="No such friendship")
-        reverse_invite = self.read_friendship(friendship.invite_receiver_id,
-                                              friendship.invite_sender_id)
+        reverse_invite = self.read_friendship_or_none(
+            friendship.invite_receiver_id,
+            friendship.invite_sender_id)
         if reverse_invite is not None:
             raise HTTPException(status_code=401,
                                 detail="Friendship already exists.")
@@ -89,15 +94,31 @@ class FriendshipDao:
         HTTPException
             Raised when no such friendship was found.
         """
-        statement = (select(Friendship)
-                     .where(Friendship.invite_receiver_id == receiver_id)
-                     .where(Friendship.invite_sender_id == sender_id))
-        friendship = self.session.exec(statement).one_or_none()
+        friendship = self.read_friendship_or_none(sender_id, receiver_id)
         if friendship is None:
             raise HTTPException(status_code=404,
                                 detail="Friendship not found.")
         return friendship
 
+    def read_friendship_or_none(self,
+                                sender_id: int,
+                                receiver_id: int) -> Optional[Friendship]:
+        """Read a single friendship, if it exists.
+
+        Parameters
+        ----------
+        sender_id : int
+            The id of the user that sent the invite.
+        receiver_id : int
+            The id of the user that received the invite.
+
+        Returns
+        -------
+        Optional[Friendship]
+            The friendship that was read, None if there is none.
+        """
+        return self.session.get(Friendship, (sender_id, receiver_id))
+
     def get_friendship(self,
                        user1_id: int,
                        user2_id: int) -> Friendship:
@@ -154,6 +175,25 @@ class FriendshipDao:
         friendships = self.session.exec(statement).all()
         return friendships
 
+    def read_friendships_among(self,
+                               user_ids: List[int]) -> List[Friendship]:
+        """Read all friendships whose sender and receiver are in a group.
+
+        Parameters
+        ----------
+        user_ids : List[int]
+            The ids of the users of the group.
+
+        Returns
+        -------
+        List[Friendship]
+            The friendships between users of the group.
+        """
+        statement = (select(Friendship)
+                     .where(col(Friendship.invite_sender_id).in_(user_ids))
+                     .where(col(Friendship.invite_receiver_id).in_(user_ids)))
+        return self.session.exec(statement).all()
+
     def delete_friendship(self,
                           sender_id: int,
                           receiver_id: int) -> Friendship:
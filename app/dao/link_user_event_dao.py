@@ -5,12 +5,20 @@ Classes
 UserEventLinkDao(session)
     Data access for links between users and events.
 """
-from typing import List
+from typing import Any, Iterable, List, Mapping, Optional, cast
 
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlalchemy import distinct, exists, func, update
+from sqlalchemy import select as core_select
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm.util import identity_key
+from sqlmodel import Session, col, select
 
+from app.models.enums import UserEventStatus
+from app.models.events import Event
 from app.models.links import UserEventLink
+from app.models.users import User, UserRead
 
 
 class UserEventLinkDao:
@@ -26,6 +34,15 @@ class UserEventLinkDao:
         Read all links of a user.
     read_event_users(event_id)
         Read all links of an event.
+    read_event_users_with_status(event_id, statuses)
+        Read the users of an event whose link has one of the statuses.
+    read_event_user_rows_with_status(event_id, statuses)
+        Same as read_event_users_with_status, as rows of UserRead fields.
+    read_most_recent_shared_event(user1_id, user2_id)
+        Read the latest event both users are linked to.
+    update_status_as_creator(creator_id, event_id, user_id, old_status,
+                             new_status)
+        Update the status of a link, on behalf of the event creator.
     update_user_event_link(user_id, event_id, new_link)
         Update a link.
     delete_user_event_link(user_id, event_id)
@@ -73,10 +90,8 @@ class UserEventLinkDao:
         HTTPException
             Raised when the link does not exist.
         """
-        statement = (select(UserEventLink)
-                     .where(UserEventLink.user_id == user_id)
-                     .where(UserEventLink.event_id == event_id))
-        link = self.session.exec(statement).one_or_none()
+        link = self.session.get(UserEventLink,
+                                {"user_id": user_id, "event_id": event_id})
         if link is None:
             raise HTTPException(status_code=404,
                                 detail="User-Event Link not found.")
@@ -112,6 +127,9 @@ class UserEventLinkDao:
     def read_all_event_users(self, event_id: int) -> List[UserEventLink]:
         """Get all links for an event.
 
+        The users of the links are loaded along with them, in one extra
+        query for all links.
+
         Parameters
         ----------
         event_id : int
@@ -128,7 +146,8 @@ class UserEventLinkDao:
             Raised when no link is found.
         """
         statement = (select(UserEventLink)
-                     .where(UserEventLink.event_id == event_id))
+                     .where(UserEventLink.event_id == event_id)
+                     .options(selectinload(UserEventLink.user)))
         links = self.session.exec(statement).all()
         if links is None:
             raise HTTPException(
@@ -136,6 +155,136 @@ class UserEventLinkDao:
                 detail=f"Event with id {event_id} has no users.")
         return links
 
+    def read_event_users_with_status(
+            self,
+            event_id: int,
+            statuses: Iterable[UserEventStatus]) -> List[User]:
+        """Get the users of an event whose link has one of the given statuses.
+
+        Parameters
+        ----------
+        event_id : int
+            The id of the event to look for.
+        statuses : Iterable[UserEventStatus]
+            The statuses the links must have.
+
+        Returns
+        -------
+        List[User]
+            The users linked to the event with one of the statuses.
+        """
+        statement = (select(User)
+                     .join(UserEventLink, UserEventLink.user_id == User.id)
+                     .where(UserEventLink.event_id == event_id)
+                     .where(col(UserEventLink.status).in_(list(statuses))))
+        return self.session.exec(statement).all()
+
+    def read_event_user_rows_with_status(
+            self,
+            event_id: int,
+            statuses: Iterable[UserEventStatus]) -> List[Mapping[str, Any]]:
+        """Get the users of an event whose link has one of the given statuses.
+
+        Rows are read as plain mappings rather than User objects, since they
+        are only used to build responses.
+
+        Parameters
+        ----------
+        event_id : int
+            The id of the event to look for.
+        statuses : Iterable[UserEventStatus]
+            The statuses the links must have.
+
+        Returns
+        -------
+        List[Mapping[str, Any]]
+            The UserRead fields of the users linked to the event.
+        """
+        columns = [getattr(User, name) for name in UserRead.__fields__]
+        statement = (core_select(*columns)
+                     .join(UserEventLink, UserEventLink.user_id == User.id)
+                     .where(UserEventLink.event_id == event_id)
+                     .where(col(UserEventLink.status).in_(list(statuses))))
+        return self.session.execute(statement).mappings().all()
+
+    def read_most_recent_shared_event(self,
+                                      user1_id: int,
+                                      user2_id: int) -> Optional[Event]:
+        """Get the event starting last among those both users are linked to.
+
+        Parameters
+        ----------
+        user1_id : int
+            The id of the first user.
+        user2_id : int
+            The id of the second user.
+
+        Returns
+        -------
+        Optional[Event]
+            The most recent shared event, None if there is none.
+        """
+        statement = (select(Event)
+                     .join(UserEventLink, UserEventLink.event_id == Event.id)
+                     .where(col(UserEventLink.user_id).in_([user1_id,
+                                                            user2_id]))
+                     .group_by(Event.id)
+                     .having(func.count(distinct(UserEventLink.user_id)) == 2)
+                     .order_by(col(Event.start_time).desc())
+                     .limit(1))
+        return self.session.exec(statement).first()
+
+    def update_status_as_creator(self,
+                                 creator_id: int,
+                                 event_id: int,
+                                 user_id: int,
+                                 old_status: UserEventStatus,
+                                 new_status: UserEventStatus) -> bool:
+        """Update the status of a link if the event creator is the caller.
+
+        The creator check and the expected status are both part of a single
+        UPDATE statement, so that nothing can change the link in between.
+
+        Parameters
+        ----------
+        creator_id : int
+            The id of the user that must have created the event.
+        event_id : int
+            The id of the event in the link.
+        user_id : int
+            The id of the user in the link.
+        old_status : UserEventStatus
+            The status the link must have to be updated.
+        new_status : UserEventStatus
+            The new status to give the link.
+
+        Returns
+        -------
+        bool
+            True if the link was updated, False otherwise.
+        """
+        creator_link = aliased(UserEventLink)
+        is_creator = (exists()
+                      .where(creator_link.user_id == creator_id)
+                      .where(creator_link.event_id == event_id)
+                      .where(creator_link.status == UserEventStatus.CREATOR))
+        statement = (update(UserEventLink)
+                     .where(UserEventLink.user_id == user_id)
+                     .where(UserEventLink.event_id == event_id)
+                     .where(UserEventLink.status == old_status)
+                     .where(is_creator)
+                     .values(status=new_status)
+                     .execution_options(synchronize_session=False))
+        result = cast(CursorResult, self.session.execute(statement))
+        # The EXISTS criterion cannot be evaluated in Python, so a link
+        # already loaded in the session is expired to be read again.
+        loaded_link = self.session.identity_map.get(
+            identity_key(UserEventLink, (user_id, event_id)))
+        if loaded_link is not None:
+            self.session.expire(loaded_link, ["status"])
+        self.session.commit()
+        return bool(result.rowcount)
+
     def update_user_event_link(self,
                                user_id: int,
                                event_id: int,
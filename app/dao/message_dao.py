@@ -5,11 +5,11 @@ Classes
 MessageDao(session)
     Data access for messages.
 """
-from datetime import datetime as dttime
-from typing import List
+from typing import Any, List, Mapping, Optional
 
 from fastapi import HTTPException
-from sqlmodel import Session, select
+from sqlalchemy import select as core_select
+from sqlmodel import Session, col, select
 
 from app.models.messages import Message
 
@@ -24,15 +24,15 @@ class MessageDao:
     -------
     create_message(self, message)
         Create a message in database
-    read_message(self, user_id, event_id, datetime)
+    read_message(self, event_id, message_id)
         Read a single message
     read_user_messages(self, user_id)
         Read all messages sent by a user
-    read_event_messages(self, event_id)
-        Read all messages sent in an event
+    read_event_messages(self, event_id, after, limit)
+        Read a page of the messages sent in an event
     read_user_messages_in_event(self, event_id, user_id)
         Read all messages sent by a user in an event
-    delete_message(self, event_id, user_id, datetime)
+    delete_message(self, event_id, message_id)
         Delete a message from database
     """
     def __init__(self, session: Session):
@@ -55,20 +55,15 @@ class MessageDao:
         self.session.commit()
         return message
 
-    def read_message(self,
-                     event_id: int,
-                     user_id: int,
-                     datetime: dttime) -> Message:
+    def read_message(self, event_id: int, message_id: int) -> Message:
         """Read a single message.
 
         Parameters
         ----------
         event_id : int
             The id of the event the message was sent in.
-        user_id : int
-            The id of the user who sent the message.
-        datetime : dttime
-            The time the message was sent.
+        message_id : int
+            The id of the message.
 
         Returns
         -------
@@ -78,14 +73,10 @@ class MessageDao:
         Raises
         ------
         HTTPException
-            Raised when no such message is found.
+            Raised when no such message is found in the event.
         """
-        statement = (select(Message)
-                     .where(Message.event_id == event_id)
-                     .where(Message.user_id == user_id)
-                     .where(Message.datetime == datetime))
-        message = self.session.exec(statement).one_or_none()
-        if message is None:
+        message = self.session.get(Message, message_id)
+        if message is None or message.event_id != event_id:
             raise HTTPException(status_code=404,
                                 detail="Message not found")
         return message
@@ -107,22 +98,39 @@ class MessageDao:
         messages = self.session.exec(statement).all()
         return messages
 
-    def read_event_messages(self, event_id: int) -> List[Message]:
-        """Read all messages in an event.
+    def read_event_messages(self,
+                            event_id: int,
+                            after: int,
+                            limit: Optional[int]) -> List[Mapping[str, Any]]:
+        """Read a page of the messages in an event, oldest first.
+
+        Pages are delimited by message id rather than by offset, so that
+        each page is a single range scan on the (event_id, id) index. Rows
+        are read as plain mappings, since they are only used to build
+        responses.
 
         Parameters
         ----------
         event_id : int
             The event the messages are in.
+        after : int
+            Only messages with an id greater than this one are read.
+        limit : Optional[int]
+            The maximum number of messages to read, None for all of them.
 
         Returns
         -------
-        List[Message]
-            All messages in event.
+        List[Mapping[str, Any]]
+            The page of messages in event.
         """
-        statement = select(Message).where(Message.event_id == event_id)
-        messages = self.session.exec(statement).all()
-        return messages
+        columns = [getattr(Message, name) for name in Message.__fields__]
+        statement = (core_select(*columns)
+                     .where(Message.event_id == event_id)
+                     .where(col(Message.id) > after)
+                     .order_by(Message.id))
+        if limit is not None:
+            statement = statement.limit(limit)
+        return self.session.execute(statement).mappings().all()
 
     def read_user_messages_in_event(self,
                                     event_id: int,
@@ -147,27 +155,22 @@ class MessageDao:
         messages = self.session.exec(statement).all()
         return messages
 
-    def delete_message(self,
-                       event_id: int,
-                       user_id: int,
-                       datetime: dttime) -> Message:
+    def delete_message(self, event_id: int, message_id: int) -> Message:
         """Delete message in database.
 
         Parameters
         ----------
         event_id : int
             The id of the event the message is in.
-        user_id : int
-            The id of the user that sent the message.
-        datetime : dttime
-            The time the message was sent.
+        message_id : int
+            The id of the message.
 
         Returns
         -------
         Message
             The deleted message.
         """
-        message = self.read_message(event_id, user_id, datetime)
+        message = self.read_message(event_id, message_id)
         self.session.delete(message)
         self.session.commit()
         return message
@@ -5,13 +5,36 @@ Classes
 UserDao(session)
     Data access for users.
 """
-from typing import List
+from typing import Any, List, Mapping, Union
 
 from fastapi import HTTPException
+from sqlalchemy import select as core_select
+from sqlalchemy import union_all
+from sqlalchemy.sql import Select
 from sqlmodel import Session, select
 from sqlalchemy.exc import IntegrityError
 
-from app.models.users import User, UserUpdate
+from app.models.enums import FriendshipStatus
+from app.models.links import Friendship
+from app.models.users import User, UserRead, UserUpdate
+
+
+def _select_invited_users(user_id: int, status: FriendshipStatus) -> Select:
+    """Select the UserRead fields of users a user sent invites to."""
+    columns = [getattr(User, name) for name in UserRead.__fields__]
+    return (core_select(*columns)
+            .join(Friendship, Friendship.invite_receiver_id == User.id)
+            .where(Friendship.invite_sender_id == user_id)
+            .where(Friendship.status == status))
+
+
+def _select_inviting_users(user_id: int, status: FriendshipStatus) -> Select:
+    """Select the UserRead fields of users a user received invites from."""
+    columns = [getattr(User, name) for name in UserRead.__fields__]
+    return (core_select(*columns)
+            .join(Friendship, Friendship.invite_sender_id == User.id)
+            .where(Friendship.invite_receiver_id == user_id)
+            .where(Friendship.status == status))
 
 
 class UserDao:
@@ -22,7 +45,7 @@ class UserDao:
 
     Methods
     -------
-    create_user(self, user)
+    create_user(self, user, commit)
         Add a new user in database.
     read_user(self, user_id)
         Read a user from database using its id.
@@ -30,21 +53,30 @@ class UserDao:
         Read users from database between offset and offset+limit.
     update_user(self, user_id, new_user)
         Update a user in database with new user data.
-    delete_user(self, user_id)
-        Delete a user from database using its id.
+    delete_user(self, user)
+        Delete a user from database using its id, or the user itself.
     read_user_by_phone(self, phone)
         Read a single user using its phone_number.
+    read_invited_user_rows(self, user_id, status)
+        Read the users a user sent invites to, as rows.
+    read_inviting_user_rows(self, user_id, status)
+        Read the users a user received invites from, as rows.
+    read_friend_rows(self, user_id)
+        Read the friends of a user, as rows.
     """
     def __init__(self, session: Session):
         self.session = session
 
-    def create_user(self, user: User) -> User:
+    def create_user(self, user: User, commit: bool = True) -> User:
         """Create a new User in DB.
 
         Parameters
         ----------
         user : User
             The user to add to database.
+        commit : bool, optional
+            False to only flush the user, so that the caller commits it along
+            with other changes, by default True.
 
         Returns
         -------
@@ -53,8 +85,10 @@ class UserDao:
         """
         try:
             self.session.add(user)
-            self.session.commit()
-            self.session.refresh(user)
+            if commit:
+                self.session.commit()
+            else:
+                self.session.flush()
             return user
         except IntegrityError as exc:
             new_exc = HTTPException(
@@ -163,13 +197,14 @@ class UserDao:
         self.session.refresh(old_user)
         return old_user
 
-    def delete_user(self, user_id: int) -> User:
-        """Delete a user using its id.
+    def delete_user(self, user: Union[int, User]) -> User:
+        """Delete a user using its id, or the user itself.
 
         Parameters
         ----------
-        user_id : int
-            The id of the user to delete.
+        user : Union[int, User]
+            The id of the user to delete, or the user if already read, which
+            saves reading it again.
 
         Returns
         -------
@@ -181,10 +216,14 @@ class UserDao:
         HTTPException
             Raised when there is no user with that id.
         """
-        user = self.session.get(User, user_id)
-        if not user:
-            raise HTTPException(status_code=404,
-                                detail=f"User with id {user_id} not found.")
+        if isinstance(user, int):
+            user_id = user
+            found_user = self.session.get(User, user_id)
+            if not found_user:
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"User with id {user_id} not found.")
+            user = found_user
         self.session.delete(user)
         self.session.commit()
         return user
@@ -219,3 +258,72 @@ class UserDao:
             self.session.commit()
             self.session.refresh(old_user)
         return old_user
+
+    def read_invited_user_rows(
+            self,
+            user_id: int,
+            status: FriendshipStatus) -> List[Mapping[str, Any]]:
+        """Read the users a user sent an invite with a given status to.
+
+        Rows are read as plain mappings rather than User objects, since they
+        are only used to build responses.
+
+        Parameters
+        ----------
+        user_id : int
+            The id of the user who sent the invites.
+        status : FriendshipStatus
+            The status the invites must have.
+
+        Returns
+        -------
+        List[Mapping[str, Any]]
+            The UserRead fields of the users the invites were sent to.
+        """
+        statement = _select_invited_users(user_id, status)
+        return self.session.execute(statement).mappings().all()
+
+    def read_inviting_user_rows(
+            self,
+            user_id: int,
+            status: FriendshipStatus) -> List[Mapping[str, Any]]:
+        """Read the users a user received an invite with a given status from.
+
+        Rows are read as plain mappings rather than User objects, since they
+        are only used to build responses.
+
+        Parameters
+        ----------
+        user_id : int
+            The id of the user who received the invites.
+        status : FriendshipStatus
+            The status the invites must have.
+
+        Returns
+        -------
+        List[Mapping[str, Any]]
+            The UserRead fields of the users the invites were received from.
+        """
+        statement = _select_inviting_users(user_id, status)
+        return self.session.execute(statement).mappings().all()
+
+    def read_friend_rows(self, user_id: int) -> List[Mapping[str, Any]]:
+        """Read the friends of a user, whoever sent the invite.
+
+        Both directions of accepted invites are read in a single UNION ALL
+        query. Rows are read as plain mappings rather than User objects.
+
+        Parameters
+        ----------
+        user_id : int
+            The id of the user whose friends to read.
+
+        Returns
+        -------
+        List[Mapping[str, Any]]
+            The UserRead fields of the friends of the user.
+        """
+        statement = union_all(
+            _select_invited_users(user_id, FriendshipStatus.ACCEPTED),
+            _select_inviting_users(user_id, FriendshipStatus.ACCEPTED))
+        return self.session.execute(statement).mappings().all()
@@ -8,7 +8,7 @@ Auth(SQLModel, table=True)
 from typing import Optional
 
 from pydantic import validator
-from sqlmodel import Field, SQLModel, UniqueConstraint
+from sqlmodel import Field, SQLModel
 
 from app.utils.validators import check_valid_phone
 
@@ -23,7 +23,6 @@ class Auth(SQLModel, table=True):
     verify_code: str
         Code used to authenticate the user.
     """
-    __table_args__ = (UniqueConstraint("phone"),)
     phone: str = Field(foreign_key='user.phone', primary_key=True)
     verify_code: Optional[str] = Field(default=None)
 
@@ -13,9 +13,16 @@ MessageCategory
     Possible types of messages.
 InteractionCatergory
     Possible types of interactions.
+EncounterCode
+    Codes of the cells of an event encounter matrix.
+
+Attributes
+----------
+PARTICIPANT_STATUSES : frozenset
+    User-Event statuses of users taking part in an event, creator included.
 """
 
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class _StrEnum(str, Enum):
@@ -37,6 +44,10 @@ class UserEventStatus(_StrEnum):
     PENDING = "pending"
 
 
+PARTICIPANT_STATUSES = frozenset({UserEventStatus.CREATOR,
+                                  UserEventStatus.ATTENDS})
+
+
 class FriendshipStatus(_StrEnum):
     """This Enum class lists the different possible status for friendships."""
     PENDING = "pending"
@@ -74,3 +85,17 @@ class InteractionCatergory(_StrEnum):
     USER_REPORTED = "user_reported"
     EVENT_POSITIVE = "positive_event"
     EVENT_NEGATIVE = "negative_event"
+
+
+class EncounterCode(IntEnum):
+    """This Enum class lists the codes stored in an encounter matrix.
+
+    Codes are small integers, so that the matrix fits in an int8 array.
+    """
+    NO_INTERACTION = 0
+    FR_SEND = 1
+    FR_IGNORED = 2
+    FR_ACCEPTED = 3
+    FR_REFUSED = 4
+    USER_REPORT = 5
+    USER_REPORTED = 6
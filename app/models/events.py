@@ -14,7 +14,7 @@ Event(SQLModel, table=True)
 from datetime import datetime as dttime
 from typing import List, Optional, TYPE_CHECKING
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.models.enums import EventCategory
 
@@ -131,6 +131,8 @@ class Event(_EventBaseStrict, table=True):
         The links between the event and the users, whether they created,
         requested of attended it.
     """
+    __table_args__ = (Index("ix_event_start_time", "start_time"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     picture: str = Field(default="default_event_pic.png")
 
@@ -7,7 +7,7 @@ LatLon(SQLModel, table=True)
 """
 from typing import Optional, TYPE_CHECKING
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 if TYPE_CHECKING:
     from app.models.events import Event
@@ -40,6 +40,9 @@ class LatLon(_LatLonBase, table=True):
     event: Event
         The event
     """
+    # Serves the bounding box prefilter of the area search.
+    __table_args__ = (Index("ix_latlon_lat_lon", "lat", "lon"),)
+
     event_id: Optional[int] = Field(default=None,
                                     foreign_key="event.id",
                                     primary_key=True)
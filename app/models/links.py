@@ -8,7 +8,7 @@ Friendship(SQLModel, table=True)
 from datetime import date as dt
 from typing import Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.models.enums import FriendshipStatus, UserEventStatus
 from app.models.events import Event
@@ -27,6 +27,9 @@ class Friendship(SQLModel, table=True):
     user_id2: Optional[int]
         id of the second User of the friendship.
     """
+    __table_args__ = (Index("ix_friendship_invite_receiver_id",
+                            "invite_receiver_id"),)
+
     invite_sender_id: Optional[int] = Field(default=None,
                                             foreign_key="user.id",
                                             primary_key=True)
@@ -63,6 +66,9 @@ class UserEventLink(SQLModel, table=True):
     text: Optional[str]
         Used when a message is sent by a user that wants to join an event.
     """
+    __table_args__ = (Index("ix_usereventlink_event_id_status",
+                            "event_id", "status"),)
+
     user_id: Optional[int] = Field(default=None,
                                    foreign_key="user.id",
                                    primary_key=True)
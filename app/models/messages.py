@@ -8,7 +8,7 @@ Message(SQLModel)
 from datetime import datetime as dttime
 from typing import Optional, TYPE_CHECKING
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Index, Relationship, SQLModel
 
 from app.models.enums import MessageCategory
 if TYPE_CHECKING:
@@ -23,6 +23,8 @@ class Message(SQLModel, table=True):
 
     Attributes
     ----------
+    id: Optional[int]
+        Unique message identifier. Filled upon creation in database.
     datetime: Optional[datetime]
         The date an time the message was sent. Fills when created.
     text: str
@@ -32,14 +34,12 @@ class Message(SQLModel, table=True):
     event: Optional[Event]
         Event the message refers to.
     """
-    event_id: Optional[int] = Field(default=None,
-                                    foreign_key="event.id",
-                                    primary_key=True)
-    user_id: Optional[int] = Field(default=None,
-                                   foreign_key="user.id",
-                                   primary_key=True)
-    datetime: Optional[dttime] = Field(default=dttime.now(),
-                                       primary_key=True)
+    __table_args__ = (Index("ix_message_event_id_id", "event_id", "id"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    event_id: Optional[int] = Field(default=None, foreign_key="event.id")
+    user_id: Optional[int] = Field(default=None, foreign_key="user.id")
+    datetime: Optional[dttime] = Field(default_factory=dttime.now)
     category: MessageCategory
     text: str = Field(max_length=3000)
 
@@ -21,8 +21,8 @@ from pydantic import validator
 from sqlmodel import Field, Relationship, SQLModel, UniqueConstraint
 
 from app.models.messages import Message
-from app.utils.regex_utils import CITY_REGEX, NAME_REGEX
-from app.utils.validators import check_valid_phone
+from app.utils.validators import (CityStr, FirstNameStr, LastNameStr,
+                                  check_valid_phone)
 if TYPE_CHECKING:
     from app.models.links import UserEventLink, Friendship
     from app.models.scores import Score
@@ -36,10 +36,10 @@ class _UserBase(SQLModel):
     For attributes and methods, see each specific class.
     """
     phone: Optional[str]
-    first_name: Optional[str] = Field(max_length=20, regex=NAME_REGEX)
-    last_name: Optional[str] = Field(max_length=40, regex=NAME_REGEX)
+    first_name: Optional[FirstNameStr]
+    last_name: Optional[LastNameStr]
     bio: Optional[str] = Field(max_length=500)
-    city: Optional[str] = Field(max_length=50, regex=CITY_REGEX)
+    city: Optional[CityStr]
 
     @classmethod
     @validator("phone")
@@ -61,8 +61,8 @@ class _UserBase(SQLModel):
 
 class _UserBaseStrict(_UserBase):
     """Similar to _UserBase, but with stricter restrictions."""
-    first_name: str = Field(max_length=20, regex=NAME_REGEX)
-    last_name: str = Field(max_length=40, regex=NAME_REGEX)
+    first_name: FirstNameStr
+    last_name: LastNameStr
     phone: str
 
 
@@ -12,11 +12,13 @@ get_user_token()
 from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from sqlmodel import Session
 from twilio.base.exceptions import TwilioRestException
 
 from app.configs.api_dependencies import get_session
-from app.configs.settings import AuthSettings
+from app.configs.settings import get_auth_settings
 from app.models.auths import Auth
 from app.models.tokens import Token, TokenData
 from app.models.users import UserCreate, UserRead
@@ -27,14 +29,16 @@ from app.utils.verify_code_utils import send_verify_code, check_verify_code
 
 router = APIRouter()
 
+ACCESS_TOKEN_EXPIRES = timedelta(minutes=get_auth_settings().token_exp)
+
 
 @router.post(path="/register",
              response_model=UserRead,
              summary="Register a new user.",
              response_description="The created user.")
-async def register(*,
-                   session: Session = Depends(get_session),
-                   user: UserCreate):
+def register(*,
+             session: Session = Depends(get_session),
+             user: UserCreate):
     """
     The input user is saved in database, altogether with an Auth object to
     store the phone number for later authentication.
@@ -55,14 +59,18 @@ async def get_verify_code(*,
 
     - **body** : the data used to login. Model TokenData.
     """
+    # The database is read in a worker thread, while the call to Twilio is
+    # awaited without holding one.
     phone_number = data.phone
     try:
-        auth = AuthService(session).read_auth_by_phone(phone_number)
-        status = send_verify_code(auth.phone)
+        auth = await run_in_threadpool(
+            AuthService(session).read_auth_by_phone, phone_number)
+        status = await send_verify_code(auth.phone)
         if status != "pending":
             raise HTTPException(status_code=500,
                                 detail="Could not send verify code")
-        return {"message": "Verification code sent successfully."}
+        return ORJSONResponse(
+            {"message": "Verification code sent successfully."})
     except TwilioRestException as exc:
         new_exc = HTTPException(
             status_code=422,
@@ -82,19 +90,19 @@ async def get_user_token(*,
 
     - **body**: The data to authenticate. Model Auth.
     """
-    db_auth = AuthService(session).read_auth_by_phone(auth.phone)
+    db_auth = await run_in_threadpool(
+        AuthService(session).read_auth_by_phone, auth.phone)
     if auth.verify_code is None:
         raise HTTPException(status_code=422,
                             detail="Must provide a verification code.")
-    status = check_verify_code(auth.phone, auth.verify_code)
+    status = await check_verify_code(auth.phone, auth.verify_code)
     if status != "approved":
         raise HTTPException(status_code=400,
                             detail="Invalid verification code.")
 
-    access_token_expires = timedelta(minutes=AuthSettings().token_exp)
     access_token = create_access_token(
         data={"sub": db_auth.phone},
-        expires_delta=access_token_expires
+        expires_delta=ACCESS_TOKEN_EXPIRES
     )
     resp_token = Token(access_token=access_token, token_type="bearer")
     return resp_token
@@ -10,9 +10,10 @@ read_event(event_id)
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends
-from sqlmodel import Session
+from fastapi.responses import ORJSONResponse
 
-from app.configs.api_dependencies import get_current_user, get_session
+from app.configs.api_dependencies import (get_current_user, get_event_service,
+                                          get_link_service)
 from app.models.addresses import AddressCreate
 from app.models.enums import UserEventStatus, EventCategory
 from app.models.events import EventCreate, EventRead
@@ -32,7 +33,7 @@ router = APIRouter(prefix="/event")
              summary="Create a new event.")
 def create_event(*,
                  current_user: User = Depends(get_current_user),
-                 session: Session = Depends(get_session),
+                 event_service: EventService = Depends(get_event_service),
                  event: EventCreate,
                  address: AddressCreate):
     """Create a new event.
@@ -40,12 +41,7 @@ def create_event(*,
     - **token**: usual authentication token
     - **event**: the event to create
     """
-    new_event = EventService(session).create_event(event, address)
-    link = UserEventLink(user_id=current_user.id,
-                         event_id=new_event.id,
-                         status=UserEventStatus.CREATOR)
-    UserEventLinkService(session).create_user_event_link(link)
-    return new_event
+    return event_service.create_event(event, address, current_user.id)
 
 
 @router.get(path="/{event_id}",
@@ -54,23 +50,25 @@ def create_event(*,
             summary="Read an event with approximate location.")
 def read_event(*,
                _: User = Depends(get_current_user),
-               session: Session = Depends(get_session),
+               event_service: EventService = Depends(get_event_service),
                event_id: int):
     """Read a single event with approximate coordinates.
 
     - **token**: usual authentication token.
     - **event_id**: the id of the event to read.
     """
-    return EventService(session).read_event_approx(event_id)
+    return event_service.read_event_approx(event_id)
 
 
 @router.get(path="/in_area/{radius}",
             response_model=List[EventReadWithLatLon],
+            response_class=ORJSONResponse,
             response_description="All events with radius around location.",
             summary="Get events to come in area.")
 def read_events_in_radius(*,
                           _: User = Depends(get_current_user),
-                          session: Session = Depends(get_session),
+                          event_service: EventService = Depends(
+                              get_event_service),
                           latlon: LatLonRead,
                           radius: int,
                           category: Optional[EventCategory]):
@@ -80,9 +78,10 @@ def read_events_in_radius(*,
     - **latlon**: coordinates around which to look for events
     - **radius**: the radius in which to look for events
     """
-    return EventService(session).read_events_to_come_in_area(latlon,
-                                                             radius,
-                                                             category)
+    events = event_service.read_events_to_come_in_area(latlon,
+                                                       radius,
+                                                       category)
+    return ORJSONResponse(events)
 
 
 @router.get(path="/join/{event_id}",
@@ -91,7 +90,7 @@ def read_events_in_radius(*,
             summary="Request to join an event")
 def ask_to_join(*,
                 current_user: User = Depends(get_current_user),
-                session: Session = Depends(get_session),
+                link_service: UserEventLinkService = Depends(get_link_service),
                 event_id: int):
     """Lets the current user request to join the event
 
@@ -101,4 +100,4 @@ def ask_to_join(*,
     link = UserEventLink(user_id=current_user.id,
                          event_id=event_id,
                          status=UserEventStatus.PENDING)
-    return UserEventLinkService(session).create_user_event_link(link)
+    return link_service.create_user_event_link(link)
@@ -12,7 +12,7 @@ delete_event(event_id)
     Delete an event
 send_message(event_id, text)
     Send a message to an event's inbox
-delete_message(event_id, user_id, datetime)
+delete_message(event_id, message_id)
     Delete a message from an event's inbox
 accept_participant(event_id, user_id)
     Accept that a user joins an event
@@ -21,15 +21,17 @@ deny_participant(event_id, user_id)
 delete_participant(event_id, user_id)
     Delete a participant from an event
 """
-from datetime import datetime as dttime
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile
-from sqlmodel import Session
 
-from app.configs.api_dependencies import get_current_user, get_session
+from app.configs.api_dependencies import (get_creator_link, get_current_user,
+                                          get_event_service,
+                                          get_link_service,
+                                          get_message_service)
 from app.models.enums import MessageCategory, UserEventStatus
 from app.models.events import EventRead, EventUpdate
+from app.models.links import UserEventLink
 from app.models.messages import Message
 from app.models.users import User, UserRead
 from app.services.event_services import EventService
@@ -44,8 +46,8 @@ router = APIRouter(prefix="/event_creator")
               response_description="The updated event.",
               summary="Update the data of an event.")
 def update_event(*,
-                 current_user: User = Depends(get_current_user),
-                 session: Session = Depends(get_session),
+                 _: UserEventLink = Depends(get_creator_link),
+                 event_service: EventService = Depends(get_event_service),
                  event_id: int,
                  new_event: EventUpdate):
     """
@@ -55,10 +57,7 @@ def update_event(*,
     - **event_id**: the id of the event to update.
     - **new_event**: the new event information.
     """
-    if UserEventLinkService(session).is_creator(current_user.id, event_id):
-        return EventService(session).update_event(event_id, new_event)
-    raise HTTPException(status_code=401,
-                        detail="Only creator of the event is authorized.")
+    return event_service.update_event(event_id, new_event)
 
 
 @router.patch(path="/event_picture/{event_id}",
@@ -66,8 +65,8 @@ def update_event(*,
               response_description="The updated event with picture.",
               summary="Update an event's page picture")
 def update_picture(*,
-                   current_user: User = Depends(get_current_user),
-                   session: Session = Depends(get_session),
+                   _: UserEventLink = Depends(get_creator_link),
+                   event_service: EventService = Depends(get_event_service),
                    event_id: int,
                    file: UploadFile):
     """
@@ -77,10 +76,7 @@ def update_picture(*,
     - **event_id**: the id of the event which needs its picture updated.
     - **file**: the picture to add to the event.
     """
-    if UserEventLinkService(session).is_creator(current_user.id, event_id):
-        return EventService(session).update_picture(event_id, file)
-    raise HTTPException(status_code=401,
-                        detail="Only creator of the event is authorized.")
+    return event_service.update_picture(event_id, file)
 
 
 @router.delete(path="/delete_event/{event_id}",
@@ -88,8 +84,8 @@ def update_picture(*,
                response_description="The deleted event.",
                summary="Delete an event altogether.")
 def delete_event(*,
-                 current_user: User = Depends(get_current_user),
-                 session: Session = Depends(get_session),
+                 _: UserEventLink = Depends(get_creator_link),
+                 event_service: EventService = Depends(get_event_service),
                  event_id: int):
     """
     Delete an event altogether.
@@ -97,10 +93,7 @@ def delete_event(*,
     - **token**: usual authentication token.
     - **event_id**: the id of the event to delete.
     """
-    if UserEventLinkService(session).is_creator(current_user.id, event_id):
-        return EventService(session).delete_event(event_id)
-    raise HTTPException(status_code=401,
-                        detail="Only creator of the event is authorized.")
+    return event_service.delete_event(event_id)
 
 
 @router.post(path="/send_message/{event_id}",
@@ -108,8 +101,9 @@ def delete_event(*,
              response_description="The created organization message.",
              summary="Send a message to the event inbox.")
 def send_message(*,
-                 current_user: User = Depends(get_current_user),
-                 session: Session = Depends(get_session),
+                 creator_link: UserEventLink = Depends(get_creator_link),
+                 message_service: MessageService = Depends(
+                     get_message_service),
                  event_id: int,
                  text: str):
     """
@@ -119,40 +113,31 @@ def send_message(*,
     - **event_id**: the id of the event to send the message in.
     - **text**: the content of the message
     """
-    if UserEventLinkService(session).is_creator(current_user.id, event_id):
-        message = Message(event_id=event_id,
-                          user_id=current_user.id,
-                          category=MessageCategory.ORGA,
-                          text=text)
-        return MessageService(session).create_message(message)
-    raise HTTPException(status_code=401,
-                        detail="Only creator of the event is authorized.")
+    message = Message(event_id=event_id,
+                      user_id=creator_link.user_id,
+                      category=MessageCategory.ORGA,
+                      text=text)
+    return message_service.create_message(message)
 
 
-@router.delete(path="/delete_message/{event_id}/{user_id}/{datetime}",
+@router.delete(path="/delete_message/{event_id}/{message_id}",
                response_model=Message,
                response_description="The deleted message.",
                summary="Delete a message.")
 def delete_message(*,
-                   current_user: User = Depends(get_current_user),
-                   session: Session = Depends(get_session),
+                   _: UserEventLink = Depends(get_creator_link),
+                   message_service: MessageService = Depends(
+                       get_message_service),
                    event_id: int,
-                   user_id: int,
-                   datetime: dttime):
+                   message_id: int):
     """
     Delete a message in the event inbox.
 
     - **token**: usual authentication token.
     - **event_id**: the id of the event the message is in.
-    - **user_id**: the id of the user that sent the message
-    - **datetime**: the date and time the message was sent.
+    - **message_id**: the id of the message to delete.
     """
-    if UserEventLinkService(session).is_creator(current_user.id, event_id):
-        return MessageService(session).delete_message(event_id,
-                                                      user_id,
-                                                      datetime)
-    raise HTTPException(status_code=401,
-                        detail="Only creator of the event is authorized.")
+    return message_service.delete_message(event_id, message_id)
 
 
 @router.patch(path="/accept_participant/{event_id}/{user_id}",
@@ -161,7 +146,8 @@ def delete_message(*,
               summary="Accept a user in an event.")
 def accept_participant(*,
                        current_user: User = Depends(get_current_user),
-                       session: Session = Depends(get_session),
+                       link_service: UserEventLinkService = Depends(
+                           get_link_service),
                        event_id: int,
                        user_id: int):
     """
@@ -171,19 +157,16 @@ def accept_participant(*,
     - **event_id**: the id of the event in which to add the user
     - **user_id**: the id of the user to add to the event
     """
-    if UserEventLinkService(session).is_creator(current_user.id, event_id):
-        link = UserEventLinkService(session).read_user_event_link(user_id,
-                                                                  event_id)
-        if link.status == UserEventStatus.PENDING:
-            return UserEventLinkService(session).update_status(
-                event_id,
-                user_id,
-                UserEventStatus.ATTENDS)
+    user = link_service.transition_status_as_creator(current_user.id,
+                                                     event_id,
+                                                     user_id,
+                                                     UserEventStatus.PENDING,
+                                                     UserEventStatus.ATTENDS)
+    if user is None:
         raise HTTPException(
             status_code=401,
-            detail="Cannot accept a user that didn't ask to join.")
-    raise HTTPException(status_code=401,
-                        detail="Only creator of the event is authorized.")
+            detail="Only the event creator can accept a join request.")
+    return user
 
 
 @router.patch(path="/reject_participant/{event_id}/{user_id}",
@@ -192,7 +175,8 @@ def accept_participant(*,
               summary="Deny a user the right to participate in the event.")
 def deny_participant(*,
                      current_user: User = Depends(get_current_user),
-                     session: Session = Depends(get_session),
+                     link_service: UserEventLinkService = Depends(
+                         get_link_service),
                      event_id: int,
                      user_id: int):
     """
@@ -204,19 +188,16 @@ def deny_participant(*,
     - **user_id**: the user to deny participation to
 
     """
-    if UserEventLinkService(session).is_creator(current_user.id, event_id):
-        link = UserEventLinkService(session).read_user_event_link(user_id,
-                                                                  event_id)
-        if link.status == UserEventStatus.PENDING:
-            return UserEventLinkService(session).update_status(
-                event_id,
-                user_id,
-                UserEventStatus.DENIED)
+    user = link_service.transition_status_as_creator(current_user.id,
+                                                     event_id,
+                                                     user_id,
+                                                     UserEventStatus.PENDING,
+                                                     UserEventStatus.DENIED)
+    if user is None:
         raise HTTPException(
             status_code=401,
-            detail="Cannot deny a user that didn't ask to join.")
-    raise HTTPException(status_code=401,
-                        detail="Only creator of the event is authorized.")
+            detail="Only the event creator can deny a join request.")
+    return user
 
 
 @router.delete(path="/delete_participant/{event_id}/{user_id}",
@@ -225,7 +206,8 @@ def deny_participant(*,
                summary="Delete a participant from the event.")
 def delete_participant(*,
                        current_user: User = Depends(get_current_user),
-                       session: Session = Depends(get_session),
+                       link_service: UserEventLinkService = Depends(
+                           get_link_service),
                        event_id: int,
                        user_id: int):
     """
@@ -235,19 +217,16 @@ def delete_participant(*,
     - **event_id**: the id of the event in which to delete the participant.
     - **user_id**: the id of the user to delete from the event.
     """
-    if UserEventLinkService(session).is_creator(current_user.id, event_id):
-        link = UserEventLinkService(session).read_user_event_link(user_id,
-                                                                  event_id)
-        if link.status == UserEventStatus.ATTENDS:
-            return UserEventLinkService(session).update_status(
-                event_id,
-                user_id,
-                UserEventStatus.DELETED)
+    user = link_service.transition_status_as_creator(current_user.id,
+                                                     event_id,
+                                                     user_id,
+                                                     UserEventStatus.ATTENDS,
+                                                     UserEventStatus.DELETED)
+    if user is None:
         raise HTTPException(
             status_code=401,
-            detail="Cannot delete a user that wasn't a participant yet.")
-    raise HTTPException(status_code=401,
-                        detail="Only creator of the event is authorized.")
+            detail="Only the event creator can delete a participant.")
+    return user
 
 
 @router.get(path="/read_requests/{event_id}",
@@ -255,15 +234,13 @@ def delete_participant(*,
             response_description="Users that asked to join the event.",
             summary="Read all users that asked to join the event")
 def read_requests(*,
-                  current_user: User = Depends(get_current_user),
-                  session: Session = Depends(get_session),
+                  _: UserEventLink = Depends(get_creator_link),
+                  link_service: UserEventLinkService = Depends(
+                      get_link_service),
                   event_id: int):
     """Read all users that asked to join the event.
 
     - **token**: usual authentication token.
     - **event_id**: the id of the event to look for.
     """
-    if UserEventLinkService(session).is_creator(current_user.id, event_id):
-        return UserEventLinkService(session).read_requests(event_id)
-    raise HTTPException(status_code=401,
-                        detail="Only creator of the event is authorized.")
+    return link_service.read_requests(event_id)
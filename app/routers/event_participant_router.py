@@ -1,6 +1,6 @@
 """This module implements API endpoints handling event operations.
 
-They all use the currently authenticated user. The user must (WIP) be a
+They all use the currently authenticated user. The user must be a
 participant in the event in order to use those endpoints.
 
 Functions
@@ -8,12 +8,15 @@ Functions
 send_picture(event_id, picture)
     Send a picture to the event.
 """
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, Query, UploadFile
+from fastapi.responses import ORJSONResponse
 
-from app.configs.api_dependencies import get_current_user, get_session
+from app.configs.api_dependencies import (get_current_user, get_link_service,
+                                          get_message_service,
+                                          get_participant_link)
+from app.models.links import UserEventLink
 from app.models.messages import Message
 from app.models.users import User, UserRead
 from app.services.message_services import MessageService
@@ -21,6 +24,10 @@ from app.services.link_user_event_services import UserEventLinkService
 
 router = APIRouter(prefix="/event_participant")
 
+# The list endpoints below return data that is already valid, so they dump it
+# directly instead of letting FastAPI validate each item again against the
+# response model, which stays declared for the documentation.
+
 
 @router.post(path="/send_picture",
              response_model=Message,
@@ -28,7 +35,9 @@ router = APIRouter(prefix="/event_participant")
              summary="Send a picture to the event inbox.")
 def send_picture(*,
                  current_user: User = Depends(get_current_user),
-                 session: Session = Depends(get_session),
+                 _: UserEventLink = Depends(get_participant_link),
+                 message_service: MessageService = Depends(
+                     get_message_service),
                  event_id: int,
                  file: UploadFile):
     """
@@ -38,39 +47,35 @@ def send_picture(*,
     - **event_id**: the id of the event in which to send a picture.
     - **file**: the picture to send.
     """
-    # TODO gotta check that the user is either participant or creator of event
-    if (UserEventLinkService(session)
-            .is_participant(current_user.id, event_id)) is False:
-        raise HTTPException(
-            status_code=401,
-            detail=f"Current user isn't allowed in event {event_id}")
-    return MessageService(session).create_picture_message(current_user.id,
-                                                          event_id,
-                                                          file)
+    return message_service.create_picture_message(current_user.id,
+                                                  event_id,
+                                                  file)
 
 
 @router.get(path="/inbox",
             response_model=List[Message],
+            response_class=ORJSONResponse,
             response_description="All messages and pictures in the event.",
             summary="Read all messages in event inbox.")
 def read_inbox(*,
-               current_user: User = Depends(get_current_user),
-               session: Session = Depends(get_session),
-               event_id: int):
+               _: UserEventLink = Depends(get_participant_link),
+               message_service: MessageService = Depends(get_message_service),
+               event_id: int,
+               after: int = 0,
+               limit: Optional[int] = Query(default=None, gt=0, le=500)):
     """
-    Read all messages in event inbox. This includes all organization messages,
-    participant addition and deletion, and all pictures.
+    Read messages in event inbox, oldest first. This includes all organization
+    messages, participant addition and deletion, and all pictures.
 
     - **token**: usual authentication token.
     - **event_id**: the id of the event in which messages must be read.
+    - **after**: the id of the last message already read, to get the next
+    page.
+    - **limit**: the maximum number of messages to read, up to 500. All of
+    them when not given.
     """
-    # TODO gotta check that the user is either participant or creator of event
-    if (UserEventLinkService(session)
-            .is_participant(current_user.id, event_id)) is False:
-        raise HTTPException(
-            status_code=401,
-            detail=f"Current user isn't allowed in event {event_id}")
-    return MessageService(session).read_event_messages(event_id)
+    messages = message_service.read_event_messages(event_id, after, limit)
+    return ORJSONResponse([dict(message) for message in messages])
 
 
 @router.get(path="/participants",
@@ -78,8 +83,9 @@ def read_inbox(*,
             response_description="All users participating in the event.",
             summary="Read all users taking part in the event.")
 def read_participants(*,
-                      current_user: User = Depends(get_current_user),
-                      session: Session = Depends(get_session),
+                      _: UserEventLink = Depends(get_participant_link),
+                      link_service: UserEventLinkService = Depends(
+                          get_link_service),
                       event_id: int):
     """
     Read all users that participate in the event, creator included.
@@ -87,9 +93,5 @@ def read_participants(*,
     - **token**: usual authentication token.
     - **event_id**: the id of the event the users take part in.
     """
-    if (UserEventLinkService(session)
-            .is_participant(current_user.id, event_id)) is False:
-        raise HTTPException(
-            status_code=401,
-            detail=f"Current user isn't allowed in event {event_id}")
-    return UserEventLinkService(session).read_participants(event_id)
+    users = link_service.read_participants(event_id)
+    return ORJSONResponse(users)
@@ -16,9 +16,9 @@ delete_friend(user_id)
     Delete a friendship from the current user's list.
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
 
-from app.configs.api_dependencies import get_current_user, get_session
+from app.configs.api_dependencies import (get_current_user,
+                                          get_friendship_service)
 from app.models.enums import FriendshipStatus
 from app.models.users import User, UserRead
 from app.services.friendship_services import FriendshipService
@@ -32,7 +32,8 @@ router = APIRouter(prefix="/friendship")
              summary="Create a friendship invite.")
 def send_invite(*,
                 current_user: User = Depends(get_current_user),
-                session: Session = Depends(get_session),
+                friend_service: FriendshipService = Depends(
+                    get_friendship_service),
                 user_id: int):
     """
     Send an invite from the current user to another one.
@@ -40,8 +41,7 @@ def send_invite(*,
     - **token** : usual authentication header token.
     - **user_id** : the id of the user to send the invite to.
     """
-    friendship = FriendshipService(session).create_friendship(current_user.id,
-                                                              user_id)
+    friendship = friend_service.create_friendship(current_user.id, user_id)
     return friendship.invite_receiver
 
 
@@ -51,7 +51,8 @@ def send_invite(*,
               summary="Accept a received friendship invite.")
 def accept_invite(*,
                   current_user: User = Depends(get_current_user),
-                  session: Session = Depends(get_session),
+                  friend_service: FriendshipService = Depends(
+                      get_friendship_service),
                   user_id: int):
     """
     Lets the current user accept a friendship invite received from another one.
@@ -59,7 +60,7 @@ def accept_invite(*,
     - **token** : usual authentication header token.
     - **user_id** : the id of the user whose invite to accept.
     """
-    friendship = (FriendshipService(session).update_friendship_status(
+    friendship = (friend_service.update_friendship_status(
         user_id,
         current_user.id,
         new_status=FriendshipStatus.ACCEPTED))
@@ -72,7 +73,8 @@ def accept_invite(*,
                summary="Rescind an invitation.")
 def unsend_invite(*,
                   current_user: User = Depends(get_current_user),
-                  session: Session = Depends(get_session),
+                  friend_service: FriendshipService = Depends(
+                      get_friendship_service),
                   user_id: int):
     """
     Rescind an invitation sent from current user to another one.
@@ -80,7 +82,7 @@ def unsend_invite(*,
     - **token** : usual authentication header token.
     - **user_id** : the id of the user the invite was sent to.
     """
-    friendship = (FriendshipService(session)
+    friendship = (friend_service
                   .delete_friendship(current_user.id, user_id))
     return friendship.invite_receiver
 
@@ -91,7 +93,8 @@ def unsend_invite(*,
                summary="Deny a friendship invite.")
 def reject_invite(*,
                   current_user: User = Depends(get_current_user),
-                  session: Session = Depends(get_session),
+                  friend_service: FriendshipService = Depends(
+                      get_friendship_service),
                   user_id: int):
     """
     Let the current user reject a friendship invite sent by another one.
@@ -99,7 +102,7 @@ def reject_invite(*,
     - **token** : usual authentication header token.
     - **user_id** : the id of the user the invite was received from.
     """
-    friendship = (FriendshipService(session)
+    friendship = (friend_service
                   .delete_friendship(user_id, current_user.id))
     return friendship.invite_sender
 
@@ -110,7 +113,8 @@ def reject_invite(*,
                summary="Delete a frienship.")
 def delete_friend(*,
                   current_user: User = Depends(get_current_user),
-                  session: Session = Depends(get_current_user),
+                  friend_service: FriendshipService = Depends(
+                      get_friendship_service),
                   user_id: int):
     """
     Let the current user delete a friendship with another one.
@@ -118,11 +122,11 @@ def delete_friend(*,
     - **token** : usual authentication header token.
     - **user_id** : the id of the user that's part of the friendship to delete.
     """
-    friendship = (FriendshipService(session)
+    friendship = (friend_service
                   .get_friendship(current_user.id, user_id))
     if (isinstance(friendship.invite_sender_id, int) and
        isinstance(friendship.invite_receiver_id, int)):
-        return (FriendshipService(session)
+        return (friend_service
                 .delete_friendship(sender_id=friendship.invite_sender_id,
                                    receiver_id=friendship.invite_receiver_id))
     raise HTTPException(401, "Error fetching friendship")
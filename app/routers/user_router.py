@@ -21,6 +21,7 @@ read_friends()
 """
 from typing import List
 from fastapi import APIRouter, Depends, UploadFile
+from fastapi.responses import ORJSONResponse
 from sqlmodel import Session
 
 from app.configs.api_dependencies import get_current_user, get_session
@@ -48,9 +49,9 @@ async def read_self(*,
                response_model=UserRead,
                response_description="Data of deleted current user.",
                summary="Delete current user.")
-async def delete_self(*,
-                      current_user: User = Depends(get_current_user),
-                      session: Session = Depends(get_session)):
+def delete_self(*,
+                current_user: User = Depends(get_current_user),
+                session: Session = Depends(get_session)):
     """
     Using only the authentication token, delete current user.
 
@@ -63,10 +64,10 @@ async def delete_self(*,
               response_model=UserRead,
               response_description="Data of the current user updated.",
               summary="Update current user data.")
-async def update_self(*,
-                      current_user: User = Depends(get_current_user),
-                      session: Session = Depends(get_session),
-                      user: UserUpdate):
+def update_self(*,
+                current_user: User = Depends(get_current_user),
+                session: Session = Depends(get_session),
+                user: UserUpdate):
     """
     Update the information of the current user.
 
@@ -80,10 +81,10 @@ async def update_self(*,
               response_model=UserRead,
               response_description="Data of the current user updated.",
               summary="Update current user bio.")
-async def update_bio(*,
-                     current_user: User = Depends(get_current_user),
-                     session: Session = Depends(get_session),
-                     new_bio: str):
+def update_bio(*,
+               current_user: User = Depends(get_current_user),
+               session: Session = Depends(get_session),
+               new_bio: str):
     """
     Update the bio of the current user.
 
@@ -96,6 +97,7 @@ async def update_bio(*,
 
 @router.get(path="/sent_invites",
             response_model=List[UserRead],
+            response_class=ORJSONResponse,
             response_description="List of users that invites were sent to.",
             summary="Read current user sent invites.")
 def read_sent_invites(*,
@@ -107,11 +109,13 @@ def read_sent_invites(*,
 
     - **token** : usual authentication header token.
     """
-    return UserService(session).read_user_sent_invites(current_user.id)
+    users = UserService(session).read_user_sent_invites(current_user.id)
+    return ORJSONResponse(users)
 
 
 @router.get(path="/received_invites",
             response_model=List[UserRead],
+            response_class=ORJSONResponse,
             response_description="List of users that sent invites.",
             summary="Read current user received invites.")
 def read_received_invites(*,
@@ -123,11 +127,13 @@ def read_received_invites(*,
 
     - **token** : usual authentication header token.
     """
-    return UserService(session).read_user_received_invites(current_user.id)
+    users = UserService(session).read_user_received_invites(current_user.id)
+    return ORJSONResponse(users)
 
 
 @router.get(path="/friends",
             response_model=List[UserRead],
+            response_class=ORJSONResponse,
             response_description="List of friends.",
             summary="Get the friends of the current user.")
 def read_friends(*,
@@ -138,7 +144,8 @@ def read_friends(*,
 
     - **token** : usual authentication header token.
     """
-    return UserService(session).read_friends(current_user.id)
+    users = UserService(session).read_friends(current_user.id)
+    return ORJSONResponse(users)
 
 
 @router.patch(path="/picture",
@@ -34,6 +34,7 @@ class AuthService:
     """
     def __init__(self, session: Session):
         self.session = session
+        self._auth_dao = AuthDao(session)
 
     def read_auths(self, offset: int, limit: int) -> List[Auth]:
         """Read all auths from offset to offset+limit.
@@ -50,7 +51,7 @@ class AuthService:
         List[Auth]
             The auths read from table.
         """
-        return AuthDao(self.session).read_auths(offset, limit)
+        return self._auth_dao.read_auths(offset, limit)
 
     def delete_auth(self, phone: str) -> Auth:
         """Delete a auth using its phone number.
@@ -65,7 +66,7 @@ class AuthService:
         Auth
             The deleted auth.
         """
-        return AuthDao(self.session).delete_auth(phone)
+        return self._auth_dao.delete_auth(phone)
 
     def read_auth_by_phone(self, phone: str) -> Auth:
         """Read a single auth using its phone number.
@@ -80,7 +81,7 @@ class AuthService:
         Auth
             The auth that was read.
         """
-        return AuthDao(self.session).read_auth_by_phone(phone)
+        return self._auth_dao.read_auth_by_phone(phone)
 
     def update_code(self,
                     phone: str,
@@ -102,4 +103,4 @@ class AuthService:
         HTTPException
             Raised when the auth does not exist.
         """
-        return AuthDao(self.session).update_code(phone, verify_code)
+        return self._auth_dao.update_code(phone, verify_code)
@@ -6,23 +6,35 @@ EventService
     Intermediate services for events.
 """
 from datetime import datetime as dttime
-from typing import List, Optional
-import os
-import shutil
+from typing import Any, Dict, List, Optional
 
 from fastapi import HTTPException, UploadFile
+import numpy as np
 from sqlmodel import Session
 
-from app.configs.settings import StaticSettings
+from app.configs.settings import get_static_settings
 from app.dao.event_dao import EventDao
 from app.models.addresses import Address, AddressCreate
-from app.models.enums import EventCategory
+from app.models.enums import EventCategory, UserEventStatus
 from app.models.events import Event, EventCreate, EventUpdate
 from app.models.latitudes_longitudes import LatLon, LatLonRead
-from app.utils.geoloc_utils import (get_latlon_from_address,
+from app.models.links import UserEventLink
+from app.models.reading_models import EventReadWithLatLon
+from app.utils.cache_utils import (area_events_cache, event_cache,
+                                   participants_cache)
+from app.utils.geoloc_utils import (get_bounding_box,
+                                    get_latlon_from_address,
                                     get_random_latlon,
-                                    is_within_radius)
-from app.utils.picture_utils import create_picture_name
+                                    get_random_latlon_arrays,
+                                    is_within_radius_batch)
+from app.utils.picture_utils import create_picture_name, save_picture
+
+# Area searches are cached on coordinates rounded to about a hundred meters,
+# so that users close to each other share the same results.
+AREA_CACHE_DECIMALS = 3
+# Below this radius, in meters, the rounding would move the search by a
+# noticeable part of the circle, so it runs uncached on the exact coordinates.
+AREA_CACHE_MIN_RADIUS = 1000
 
 
 class EventService:
@@ -32,8 +44,8 @@ class EventService:
 
     Methods
     -------
-    create_event(event)
-        Create a new event.s
+    create_event(event, address, creator_id)
+        Create a new event with its creator.
     delete_event(sender_id, receiver_id)
         Delete a event.
     update_event_status(sender_id, receiver_id)
@@ -41,16 +53,25 @@ class EventService:
     """
     def __init__(self, session: Session):
         self.session = session
+        self._event_dao = EventDao(session)
 
     def create_event(self,
                      event: EventCreate,
-                     address: AddressCreate) -> Event:
-        """Create a frienship in database.
+                     address: AddressCreate,
+                     creator_id: int) -> Event:
+        """Create an event in database, along with its creator link.
+
+        The event, its location and the link to its creator are inserted in
+        a single transaction.
 
         Parameters
         ----------
         event : Event
             The new event to create.
+        address : AddressCreate
+            The address of the event.
+        creator_id : int
+            The id of the user creating the event.
 
         Returns
         -------
@@ -60,11 +81,10 @@ class EventService:
         new_event = Event.parse_obj(event)
         new_event.address = Address.parse_obj(address)
         new_event.latlon = get_latlon_from_address(address)
-        db_event = EventDao(self.session).create_event(new_event)
-        try:
-            os.mkdir(path=f"{StaticSettings().events_dir}/event_{db_event.id}")
-        except FileExistsError:
-            pass
+        new_event.user_links = [UserEventLink(user_id=creator_id,
+                                              status=UserEventStatus.CREATOR)]
+        db_event = self._event_dao.create_event(new_event)
+        area_events_cache.clear()
         return db_event
 
     def read_event(self, event_id: int) -> Event:
@@ -80,11 +100,14 @@ class EventService:
         Event
             The event that was read.
         """
-        return EventDao(self.session).read_event(event_id)
+        return self._event_dao.read_event(event_id)
 
-    def read_event_approx(self, event_id: int) -> Event:
+    def read_event_approx(self, event_id: int) -> EventReadWithLatLon:
         """Read an event with approximate coordinates.
 
+        The result is cached for a short time, which also keeps repeated
+        reads from averaging out the random offset of the coordinates.
+
         Parameters
         ----------
         event_id : int
@@ -92,7 +115,7 @@ class EventService:
 
         Returns
         -------
-        Event
+        EventReadWithLatLon
             The event that was read.
 
         Raises
@@ -100,13 +123,20 @@ class EventService:
         HTTPException
             Raised when the event has no coordinates.
         """
-        event = EventDao(self.session).read_event(event_id)
+        cached_event = event_cache.get(event_id)
+        if cached_event is not None:
+            return cached_event
+        event = self._event_dao.read_event(event_id)
         if event.latlon is None:
             raise HTTPException(status_code=421,
                                 detail="Event does not have coordinates")
+        # The event stays as read, so the session never holds fake coordinates
         new_latlon = get_random_latlon(event.latlon)
-        event.latlon = new_latlon
-        return event
+        approx_event = EventReadWithLatLon.from_orm(event)
+        approx_event.latlon = LatLonRead(lat=new_latlon.lat,
+                                         lon=new_latlon.lon)
+        event_cache.set(event_id, approx_event)
+        return approx_event
 
     def update_event(self,
                      event_id: int,
@@ -125,7 +155,10 @@ class EventService:
         Event
             The updated event.
         """
-        return EventDao(self.session).update_event(event_id, new_event)
+        event = self._event_dao.update_event(event_id, new_event)
+        event_cache.invalidate(event_id)
+        area_events_cache.clear()
+        return event
 
     def delete_event(self,
                      event_id: int) -> Event:
@@ -142,7 +175,11 @@ class EventService:
         Event
             The deleted event.
         """
-        return EventDao(self.session).delete_event(event_id)
+        event = self._event_dao.delete_event(event_id)
+        event_cache.invalidate(event_id)
+        area_events_cache.clear()
+        participants_cache.invalidate(event_id)
+        return event
 
     def update_picture(self, event_id: int, picture: UploadFile) -> Event:
         """Update an event page picture.
@@ -159,15 +196,15 @@ class EventService:
         Event
             The updated event.
         """
-        file_path = StaticSettings().event_page_pic_dir
+        file_path = get_static_settings().event_page_pic_dir
 
         token_name = create_picture_name(picture)
 
-        event = EventDao(self.session).update_picture(event_id, token_name)
+        event = self._event_dao.update_picture(event_id, token_name)
+        event_cache.invalidate(event_id)
+        area_events_cache.clear()
 
-        with open(f"{file_path}/{event.picture}", "wb") as buffer:
-            shutil.copyfileobj(picture.file, buffer)
-        picture.file.close()
+        save_picture(picture, f"{file_path}/{event.picture}")
 
         return event
 
@@ -175,33 +212,72 @@ class EventService:
             self,
             latlon: LatLonRead,
             radius: int,
-            category: Optional[EventCategory]) -> List[Event]:
+            category: Optional[EventCategory]) -> List[Dict[str, Any]]:
         """Read all events to come within radius arount coordinates.
 
+        Only the events within a bounding box of the circle are read from
+        the database. They are read as plain rows and their coordinates are
+        checked and randomized as arrays, without building an Event per row.
+        From AREA_CACHE_MIN_RADIUS, the search is centered on the coordinates
+        rounded to AREA_CACHE_DECIMALS, about a hundred meters. Results are
+        then cached for a short time per rounded coordinates, radius and
+        category, and dropped whenever an event changes. Smaller searches are
+        centered on the exact coordinates and not cached.
+
         Parameters
         ----------
         latlon : LatLonRead
             The coordinates around which to search.
         radius : int
             The radius in which to search.
+        category : Optional[EventCategory]
+            The category of events to read, None for all of them.
 
         Returns
         -------
-        List[Event]
-            The read events.
+        List[Dict[str, Any]]
+            The read events, as EventReadWithLatLon fields with approximate
+            coordinates.
         """
-        # TODO Check whether that shit works
-        events = EventDao(self.session).read_all_events()
-        wanted_events: List[Event] = []
-        full_latlon = LatLon.parse_obj(latlon)
-
-        for event in events:
-            if event.latlon is None:
-                raise HTTPException(status_code=421,
-                                    detail="Event has no coordinates.")
-            verify = is_within_radius(full_latlon, event.latlon, radius)
-            if event.start_time > dttime.now() and verify is True:
-                if category is None or event.category == category:
-                    event.latlon = get_random_latlon(event.latlon)
-                    wanted_events.append(event)
-        return wanted_events
+        cache_key = None
+        if radius >= AREA_CACHE_MIN_RADIUS:
+            cache_key = (round(latlon.lat, AREA_CACHE_DECIMALS),
+                         round(latlon.lon, AREA_CACHE_DECIMALS),
+                         radius,
+                         category)
+            cached_events = area_events_cache.get(cache_key)
+            if cached_events is not None:
+                return cached_events
+            # The search runs around the rounded coordinates of the key, so
+            # that the cached result holds for every caller sharing that key.
+            center = LatLon(lat=cache_key[0], lon=cache_key[1])
+        else:
+            center = LatLon(lat=latlon.lat, lon=latlon.lon)
+
+        rows = self._event_dao.read_event_rows_to_come_in_box(
+            dttime.now(), get_bounding_box(center, radius), category)
+        if not rows:
+            if cache_key is not None:
+                area_events_cache.set(cache_key, [])
+            return []
+
+        lats = np.fromiter((row["lat"] for row in rows),
+                           dtype=np.float64, count=len(rows))
+        lons = np.fromiter((row["lon"] for row in rows),
+                           dtype=np.float64, count=len(rows))
+        mask = is_within_radius_batch(center, lats, lons, radius)
+        wanted = np.flatnonzero(mask)
+        new_lats, new_lons = get_random_latlon_arrays(lats[wanted],
+                                                      lons[wanted])
+
+        events = []
+        for index, lat, lon in zip(wanted.tolist(),
+                                   new_lats.tolist(),
+                                   new_lons.tolist()):
+            event = dict(rows[index])
+            del event["lat"], event["lon"]
+            event["latlon"] = {"lat": lat, "lon": lon}
+            events.append(event)
+        if cache_key is not None:
+            area_events_cache.set(cache_key, events)
+        return events
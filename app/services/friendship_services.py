@@ -6,14 +6,16 @@ FriendshipService
     Intermediate services for friendships.
 """
 from datetime import date as dt
+from typing import List
 
 from fastapi import HTTPException
 from sqlmodel import Session
 
 from app.dao.friendship_dao import FriendshipDao
+from app.dao.link_user_event_dao import UserEventLinkDao
 from app.models.enums import FriendshipStatus
 from app.models.links import Friendship
-from app.services.link_user_event_services import UserEventLinkService
+from app.utils.cache_utils import friends_cache
 
 
 class FriendshipService:
@@ -31,9 +33,13 @@ class FriendshipService:
         Delete a friendship.
     update_friendship_status(sender_id, receiver_id)
         Update a friendship's status.
+    read_friendships_among(user_ids)
+        Read friendships between users of a group.
     """
     def __init__(self, session: Session):
         self.session = session
+        self._friendship_dao = FriendshipDao(session)
+        self._link_dao = UserEventLinkDao(session)
 
     def create_friendship(self,
                           sender_id: int,
@@ -50,26 +56,19 @@ class FriendshipService:
         Friendship
             The friendship created.
         """
-        shared_events = UserEventLinkService(self.session).find_shared_events(
-                                                                sender_id,
-                                                                receiver_id)
-        if not shared_events:
+        most_recent_event = (self._link_dao
+                             .read_most_recent_shared_event(sender_id,
+                                                            receiver_id))
+        if most_recent_event is None:
             raise HTTPException(
                 status_code=401,
                 detail="Cannot send invite if there was no event in common.")
-        # most_recent_event = sorted(
-        #     shared_events,
-        #     key=lambda x: EventDao(self.session).read_event(
-        #         x.event_id).start_time, reverse=True)[0]
-        most_recent_event = sorted(shared_events,
-                                   key=lambda x: x.event.start_time,
-                                   reverse=True)[0]
         friendship = Friendship(invite_sender_id=sender_id,
                                 invite_receiver_id=receiver_id,
                                 date=dt.today(),
                                 status=FriendshipStatus.PENDING,
-                                event_id=most_recent_event.event_id)
-        return FriendshipDao(self.session).create_friendship(friendship)
+                                event_id=most_recent_event.id)
+        return self._friendship_dao.create_friendship(friendship)
 
     def get_friendship(self,
                        user1_id: int,
@@ -91,7 +90,7 @@ class FriendshipService:
         Friendship
             The friendship that was read.
         """
-        return FriendshipDao(self.session).get_friendship(user1_id, user2_id)
+        return self._friendship_dao.get_friendship(user1_id, user2_id)
 
     def update_friendship_status(self,
                                  sender_id: int,
@@ -113,8 +112,13 @@ class FriendshipService:
         Friendship
             The updated friendship.
         """
-        return (FriendshipDao(self.session)
-                .update_friendship_status(sender_id, receiver_id, new_status))
+        friendship = (self._friendship_dao
+                      .update_friendship_status(sender_id,
+                                                receiver_id,
+                                                new_status))
+        friends_cache.invalidate(sender_id)
+        friends_cache.invalidate(receiver_id)
+        return friendship
 
     def read_friendship(self,
                         sender_id: int,
@@ -138,8 +142,23 @@ class FriendshipService:
         HTTPException
             Raised when no such friendship was found.
         """
-        return FriendshipDao(self.session).read_friendship(sender_id,
-                                                           receiver_id)
+        return self._friendship_dao.read_friendship(sender_id, receiver_id)
+
+    def read_friendships_among(self,
+                               user_ids: List[int]) -> List[Friendship]:
+        """Read all friendships whose sender and receiver are in a group.
+
+        Parameters
+        ----------
+        user_ids : List[int]
+            The ids of the users of the group.
+
+        Returns
+        -------
+        List[Friendship]
+            The friendships between users of the group.
+        """
+        return self._friendship_dao.read_friendships_among(user_ids)
 
     def delete_friendship(self,
                           sender_id: int,
@@ -158,5 +177,8 @@ class FriendshipService:
         Friendship
             The deleted friendship.
         """
-        return FriendshipDao(self.session).delete_friendship(sender_id,
-                                                             receiver_id)
+        friendship = self._friendship_dao.delete_friendship(sender_id,
+                                                            receiver_id)
+        friends_cache.invalidate(sender_id)
+        friends_cache.invalidate(receiver_id)
+        return friendship
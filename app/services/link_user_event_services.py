@@ -5,13 +5,16 @@ Classes
 UserEventLinkService
     Intermediate services for links between users and events.
 """
-from typing import List
+from typing import Any, Dict, List, Optional
+
 from sqlmodel import Session
 
 from app.dao.link_user_event_dao import UserEventLinkDao
-from app.models.enums import UserEventStatus
+from app.models.enums import PARTICIPANT_STATUSES, UserEventStatus
+from app.models.events import Event
 from app.models.links import UserEventLink
 from app.models.users import User
+from app.utils.cache_utils import participants_cache
 
 
 class UserEventLinkService:
@@ -25,11 +28,17 @@ class UserEventLinkService:
         Read a single user-event link
     read_participants(self, event_id)
         Read all participants of the event
-    is_participant_or_creator(self, user_id, event_id)
-        Verify that the user takes part in the event
+    read_most_recent_shared_event(self, user_id1, user_id2)
+        Read the latest event both users are linked to
+    update_status(self, event_id, user_id, new_status)
+        Update the status of a user-event link
+    transition_status_as_creator(self, creator_id, event_id, user_id,
+                                 old_status, new_status)
+        Update the status of a link on behalf of the event creator
     """
     def __init__(self, session: Session):
         self.session = session
+        self._link_dao = UserEventLinkDao(session)
 
     def create_user_event_link(self, link: UserEventLink) -> UserEventLink:
         """Create a link between user and event.
@@ -44,7 +53,9 @@ class UserEventLinkService:
         UserEventLink
             The created link.
         """
-        return UserEventLinkDao(self.session).create_user_event_link(link)
+        created_link = self._link_dao.create_user_event_link(link)
+        participants_cache.invalidate(created_link.event_id)
+        return created_link
 
     def read_user_event_link(self,
                              user_id: int,
@@ -63,12 +74,13 @@ class UserEventLinkService:
         UserEventLink
             The link that was read.
         """
-        return UserEventLinkDao(self.session).read_user_event_link(user_id,
-                                                                   event_id)
+        return self._link_dao.read_user_event_link(user_id, event_id)
 
-    def read_participants(self, event_id: int) -> List[User]:
+    def read_participants(self, event_id: int) -> List[Dict[str, Any]]:
         """Read all users that participate in the event.
 
+        The result is cached for a short time.
+
         Parameters
         ----------
         event_id : int
@@ -76,15 +88,16 @@ class UserEventLinkService:
 
         Returns
         -------
-        List[UserEventLink]
-            The list of users that participate in the event.
+        List[Dict[str, Any]]
+            The UserRead fields of the users that participate in the event.
         """
-        links = UserEventLinkDao(self.session).read_all_event_users(event_id)
-        participants: List[User] = []
-        for link in links:
-            if link.status in [UserEventStatus.CREATOR,
-                               UserEventStatus.ATTENDS]:
-                participants.append(link.user)
+        cached_users = participants_cache.get(event_id)
+        if cached_users is not None:
+            return cached_users
+        rows = self._link_dao.read_event_user_rows_with_status(
+            event_id, PARTICIPANT_STATUSES)
+        participants = [dict(row) for row in rows]
+        participants_cache.set(event_id, participants)
         return participants
 
     def update_status(self,
@@ -107,59 +120,58 @@ class UserEventLinkService:
         UserEventLink
             The updated link.
         """
-        link = UserEventLinkDao(self.session).read_user_event_link(user_id,
-                                                                   event_id)
+        link = self._link_dao.read_user_event_link(user_id, event_id)
         link.status = new_status
         self.session.add(link)
         self.session.commit()
+        participants_cache.invalidate(event_id)
         return link
 
-    def is_participant(self, user_id: int, event_id: int) -> bool:
-        """Verifies weather the user attends or creates the event.
-
-        Parameters
-        ----------
-        user_id : int
-            The id of the user to check.
-        event_id : int
-            The if of the event to check.
-
-        Returns
-        -------
-        bool
-            True if the user is participant or creator, False otherwise.
-        """
-        link = UserEventLinkDao(self.session).read_user_event_link(user_id,
-                                                                   event_id)
-        if link.status in [UserEventStatus.CREATOR, UserEventStatus.ATTENDS]:
-            return True
-        return False
+    def transition_status_as_creator(self,
+                                     creator_id: int,
+                                     event_id: int,
+                                     user_id: int,
+                                     old_status: UserEventStatus,
+                                     new_status: UserEventStatus
+                                     ) -> Optional[User]:
+        """Update a link status on behalf of the event creator.
 
-    def is_creator(self, user_id: int, event_id: int) -> bool:
-        """Verify whether the user created the event.
+        The link is only updated if creator_id created the event and the link
+        has the expected status.
 
         Parameters
         ----------
-        user_id : int
-            The id of the user to check.
+        creator_id : int
+            The id of the user that must have created the event.
         event_id : int
-            The id of the event to check.
+            The id of the event in the link.
+        user_id : int
+            The id of the user in the link.
+        old_status : UserEventStatus
+            The status the link must have to be updated.
+        new_status : UserEventStatus
+            The new status to give the relationship.
 
         Returns
         -------
-        bool
-            True if the user created the event. False otherwise.
+        Optional[User]
+            The user of the updated link, None if it could not be updated.
         """
-        link = UserEventLinkDao(self.session).read_user_event_link(user_id,
-                                                                   event_id)
-        if link.status == UserEventStatus.CREATOR:
-            return True
-        return False
-
-    def find_shared_events(self,
-                           user_id1: int,
-                           user_id2: int) -> List[UserEventLink]:
-        """Find events that are attended by both users.
+        updated = (self._link_dao
+                   .update_status_as_creator(creator_id,
+                                             event_id,
+                                             user_id,
+                                             old_status,
+                                             new_status))
+        if not updated:
+            return None
+        participants_cache.invalidate(event_id)
+        return self.session.get(User, user_id)
+
+    def read_most_recent_shared_event(self,
+                                      user_id1: int,
+                                      user_id2: int) -> Optional[Event]:
+        """Find the most recent event that both users are linked to.
 
         Parameters
         ----------
@@ -170,20 +182,11 @@ class UserEventLinkService:
 
         Returns
         -------
-        List[UserEventLink]
-            The list of shared events.
+        Optional[Event]
+            The shared event starting last, None if there is none.
         """
-        # Find all events for the first user
-        events1 = UserEventLinkDao(self.session).read_all_user_events(user_id1)
-        # Find all events for the second user
-        events2 = UserEventLinkDao(self.session).read_all_user_events(user_id2)
-        shared_events: List[UserEventLink] = []
-        # Find the intersection of both event lists
-        for event1 in events1:
-            for event2 in events2:
-                if event1.event_id == event2.event_id:
-                    shared_events.append(event1)
-        return shared_events
+        return (self._link_dao
+                .read_most_recent_shared_event(user_id1, user_id2))
 
     def read_requests(self, event_id: int) -> List[User]:
         """Read all users that asked to join the event.
@@ -198,9 +201,6 @@ class UserEventLinkService:
         List[User]
             The users that asked to join the event.
         """
-        links = UserEventLinkDao(self.session).read_all_event_users(event_id)
-        users: List[User] = []
-        for link in links:
-            if link.status == UserEventStatus.PENDING:
-                users.append(link.user)
-        return users
+        return (self._link_dao
+                .read_event_users_with_status(event_id,
+                                              [UserEventStatus.PENDING]))
@@ -5,18 +5,17 @@ Classes
 MessageService
     Intermediate services for messages.
 """
-from datetime import datetime as dttime
-from typing import List
-import shutil
+from typing import Any, List, Mapping, Optional
+import os
 
 from fastapi import UploadFile
 from sqlmodel import Session
 
-from app.configs.settings import StaticSettings
+from app.configs.settings import get_static_settings
 from app.dao.message_dao import MessageDao
 from app.models.enums import MessageCategory
 from app.models.messages import Message
-from app.utils.picture_utils import create_picture_name
+from app.utils.picture_utils import create_picture_name, save_picture
 
 
 class MessageService:
@@ -26,15 +25,16 @@ class MessageService:
     -------
     create_message(self, message)
         Create a general message
-    read_event_messages(self, event_id)
-        Read all messages in event inbox
+    read_event_messages(self, event_id, after, limit)
+        Read a page of messages in event inbox
     create_picture_message(self, user_id, event_id, picture)
         Create a message containing a picture, and save said picture.
-    delete_message(self, user_id, event_id, datetime)
+    delete_message(self, event_id, message_id)
         Delete a single message.
     """
     def __init__(self, session: Session) -> None:
         self.session = session
+        self._message_dao = MessageDao(session)
 
     def create_message(self, message: Message) -> Message:
         """Create a general message.
@@ -49,22 +49,29 @@ class MessageService:
         Message
             The created message
         """
-        return MessageDao(self.session).create_message(message)
+        return self._message_dao.create_message(message)
 
-    def read_event_messages(self, event_id: int) -> List[Message]:
-        """Read all messages sent in the event.
+    def read_event_messages(self,
+                            event_id: int,
+                            after: int,
+                            limit: Optional[int]) -> List[Mapping[str, Any]]:
+        """Read a page of the messages sent in the event.
 
         Parameters
         ----------
         event_id : int
             The event whose messages to read.
+        after : int
+            The id of the last message already read, 0 to start over.
+        limit : Optional[int]
+            The maximum number of messages to read, None for all of them.
 
         Returns
         -------
-        List[Message]
-            The messages in the event.
+        List[Mapping[str, Any]]
+            The messages in the event, as rows of message fields.
         """
-        return MessageDao(self.session).read_event_messages(event_id)
+        return self._message_dao.read_event_messages(event_id, after, limit)
 
     def create_picture_message(self,
                                user_id: int,
@@ -86,40 +93,33 @@ class MessageService:
         Message
             The created message.
         """
-        file_path = f"{StaticSettings().events_dir}/event_{event_id}"
+        file_path = f"{get_static_settings().events_dir}/event_{event_id}"
 
         token_name = create_picture_name(picture)
 
-        with open(f"{file_path}/{token_name}", "wb") as buffer:
-            shutil.copyfileobj(picture.file, buffer)
-        picture.file.close()
+        # The folder of an event is only created with its first picture.
+        os.makedirs(file_path, exist_ok=True)
+        save_picture(picture, f"{file_path}/{token_name}")
 
         message = Message(event_id=event_id,
                           user_id=user_id,
                           category=MessageCategory.PICTURE,
                           text=token_name)
-        return MessageDao(self.session).create_message(message)
+        return self._message_dao.create_message(message)
 
-    def delete_message(self,
-                       event_id: int,
-                       user_id: int,
-                       datetime: dttime) -> Message:
+    def delete_message(self, event_id: int, message_id: int) -> Message:
         """Delete a single message.
 
         Parameters
         ----------
         event_id : int
             The id of the event the message is posted in.
-        user_id : int
-            The id of the user that sent the message
-        datetime : dttime
-            The time the message was posted.
+        message_id : int
+            The id of the message.
 
         Returns
         -------
         Message
             The deleted message.
         """
-        return MessageDao(self.session).delete_message(event_id,
-                                                       user_id,
-                                                       datetime)
+        return self._message_dao.delete_message(event_id, message_id)
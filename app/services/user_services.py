@@ -5,19 +5,19 @@ Classes
 UserService
     Intermediate services for users.
 """
-from typing import List
-import shutil
+from typing import Any, Dict, List
 
 from fastapi import UploadFile
 from sqlmodel import Session
 
-from app.configs.settings import StaticSettings
+from app.configs.settings import get_static_settings
 from app.dao.auth_dao import AuthDao
 from app.dao.user_dao import UserDao
 from app.models.auths import Auth
 from app.models.enums import FriendshipStatus
 from app.models.users import User, UserCreate, UserUpdate
-from app.utils.picture_utils import create_picture_name
+from app.utils.cache_utils import friends_cache
+from app.utils.picture_utils import create_picture_name, save_picture
 
 
 class UserService:
@@ -47,10 +47,14 @@ class UserService:
 
     def __init__(self, session: Session):
         self.session = session
+        self._user_dao = UserDao(session)
+        self._auth_dao = AuthDao(session)
 
     def create_user(self, user: UserCreate) -> User:
         """Create a new user in database.
 
+        The user and its auth are committed together, in one transaction.
+
         Parameters
         ----------
         user : UserCreate
@@ -62,9 +66,9 @@ class UserService:
             The created user.
         """
         new_user = User.parse_obj(user)
-        db_user = UserDao(self.session).create_user(new_user)
+        db_user = self._user_dao.create_user(new_user, commit=False)
         new_auth = Auth(phone=db_user.phone)
-        AuthDao(self.session).create_auth(new_auth)
+        self._auth_dao.create_auth(new_auth)
         return db_user
 
     def read_user(self, user_id: int) -> User:
@@ -80,7 +84,7 @@ class UserService:
         User
             The user that was read.
         """
-        return UserDao(self.session).read_user(user_id)
+        return self._user_dao.read_user(user_id)
 
     def read_user_by_phone(self, phone: str) -> User:
         """Read a user using its phone number.
@@ -100,7 +104,7 @@ class UserService:
         HTTPException
             Raised when the user cannot be found.
         """
-        return UserDao(self.session).read_user_by_phone(phone)
+        return self._user_dao.read_user_by_phone(phone)
 
     def read_users(self, offset: int, limit: int) -> List[User]:
         """Read all users from offset to offset+limit in the table.
@@ -117,7 +121,7 @@ class UserService:
         List[User]
             The users read from table.
         """
-        return UserDao(self.session).read_users(offset, limit)
+        return self._user_dao.read_users(offset, limit)
 
     def update_user(self, user_id: int, user: UserUpdate) -> User:
         """Update a user with chosen id with new user data.
@@ -134,7 +138,9 @@ class UserService:
         User
             The updated user.
         """
-        return UserDao(self.session).update_user(user_id, user)
+        updated_user = self._user_dao.update_user(user_id, user)
+        self._invalidate_friends_of(user_id)
+        return updated_user
 
     def delete_user(self, user_id: int) -> User:
         """Delete a user using its id.
@@ -149,12 +155,17 @@ class UserService:
         User
             The deleted user.
         """
-        user = UserDao(self.session).read_user(user_id)
-        AuthDao(self.session).delete_auth(user.phone)
-        return UserDao(self.session).delete_user(user_id)
-
-    def read_user_sent_invites(self, user_id: int) -> List[User]:
-        """Read a user's sent invites recepients.
+        user = self._user_dao.read_user(user_id)
+        friend_rows = self._user_dao.read_friend_rows(user_id)
+        self._auth_dao.delete_auth(user.phone)
+        deleted_user = self._user_dao.delete_user(user)
+        friends_cache.invalidate(user_id)
+        for row in friend_rows:
+            friends_cache.invalidate(row["id"])
+        return deleted_user
+
+    def read_user_sent_invites(self, user_id: int) -> List[Dict[str, Any]]:
+        """Read a user's sent invites receivers.
 
         Parameters
         ----------
@@ -163,17 +174,15 @@ class UserService:
 
         Returns
         -------
-        List[User]
-            The users that the invites were sent to.
+        List[Dict[str, Any]]
+            The UserRead fields of the users that the invites were sent to.
         """
-        user = UserDao(self.session).read_user(user_id)
-        users = []
-        for invite in user.sent_invites:
-            if invite.status == FriendshipStatus.PENDING:
-                users.append(invite.invite_receiver)
-        return users
-
-    def read_user_received_invites(self, user_id: int) -> List[User]:
+        rows = self._user_dao.read_invited_user_rows(user_id,
+                                                     FriendshipStatus.PENDING)
+        return [dict(row) for row in rows]
+
+    def read_user_received_invites(self,
+                                   user_id: int) -> List[Dict[str, Any]]:
         """Read a user's received invites senders.
 
         Parameters
@@ -183,19 +192,19 @@ class UserService:
 
         Returns
         -------
-        List[User]
-            The users that the invites were received from.
+        List[Dict[str, Any]]
+            The UserRead fields of the users that the invites were received
+            from.
         """
-        user = UserDao(self.session).read_user(user_id)
-        users = []
-        for invite in user.received_invites:
-            if invite.status == FriendshipStatus.PENDING:
-                users.append(invite.invite_sender)
-        return users
-
-    def read_friends(self, user_id: int) -> List[User]:
+        rows = self._user_dao.read_inviting_user_rows(user_id,
+                                                      FriendshipStatus.PENDING)
+        return [dict(row) for row in rows]
+
+    def read_friends(self, user_id: int) -> List[Dict[str, Any]]:
         """Read all friends of a user.
 
+        The result is cached for a short time.
+
         Parameters
         ----------
         user_id : int
@@ -203,19 +212,31 @@ class UserService:
 
         Returns
         -------
-        List[User]
-            The friends of said user.
+        List[Dict[str, Any]]
+            The UserRead fields of the friends of said user.
         """
-        user = UserDao(self.session).read_user(user_id)
-        friends = []
-        for invite in user.sent_invites:
-            if invite.status == FriendshipStatus.ACCEPTED:
-                friends.append(invite.invite_receiver)
-        for invite in user.received_invites:
-            if invite.status == FriendshipStatus.ACCEPTED:
-                friends.append(invite.invite_sender)
+        cached_friends = friends_cache.get(user_id)
+        if cached_friends is not None:
+            return cached_friends
+        rows = self._user_dao.read_friend_rows(user_id)
+        friends = [dict(row) for row in rows]
+        friends_cache.set(user_id, friends)
         return friends
 
+    def _invalidate_friends_of(self, user_id: int) -> None:
+        """Drop the cached friends of the friends of a user.
+
+        Their cached lists hold the data of this user, which just changed.
+
+        Parameters
+        ----------
+        user_id : int
+            The id of the user whose data changed.
+        """
+        friends_cache.invalidate(user_id)
+        for row in self._user_dao.read_friend_rows(user_id):
+            friends_cache.invalidate(row["id"])
+
     def update_picture(self, user_id: int, picture: UploadFile) -> User:
         """Update a user picture.
 
@@ -236,14 +257,13 @@ class UserService:
         HTTPException
             Raised when the picture format is not allowed.
         """
-        file_path = StaticSettings().user_page_pic_dir
+        file_path = get_static_settings().user_page_pic_dir
 
         token_name = create_picture_name(picture)
 
-        user = UserDao(self.session).update_picture(user_id, token_name)
+        user = self._user_dao.update_picture(user_id, token_name)
+        self._invalidate_friends_of(user_id)
 
-        with open(f"{file_path}/{user.picture}", "wb") as buffer:
-            shutil.copyfileobj(picture.file, buffer)
-        picture.file.close()
+        save_picture(picture, f"{file_path}/{user.picture}")
 
         return user
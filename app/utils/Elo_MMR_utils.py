@@ -4,22 +4,37 @@ Functions
 ---------
 generate_encounter_matrix(session, event_id)
     Generate an encounter matrix for a given event.
+decode_encounter_matrix(matrix)
+    Convert an encounter matrix of codes to their names.
 """
 
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
-from fastapi import HTTPException
+import numpy as np
 from sqlmodel import Session
 
 
-from app.models.enums import FriendshipStatus
+from app.models.enums import EncounterCode, FriendshipStatus
 from app.services.friendship_services import FriendshipService
 from app.services.link_user_event_services import UserEventLinkService
 
+# Codes of the (sender, receiver) cells for each friendship status.
+_STATUS_CODES: Dict[FriendshipStatus,
+                    Tuple[EncounterCode, EncounterCode]] = {
+    FriendshipStatus.PENDING: (EncounterCode.FR_SEND,
+                               EncounterCode.FR_IGNORED),
+    FriendshipStatus.ACCEPTED: (EncounterCode.FR_SEND,
+                                EncounterCode.FR_ACCEPTED),
+    FriendshipStatus.DENIED: (EncounterCode.FR_SEND,
+                              EncounterCode.FR_REFUSED),
+    FriendshipStatus.REPORT: (EncounterCode.USER_REPORT,
+                              EncounterCode.USER_REPORTED),
+}
+
 
 def generate_encounter_matrix(
      session: Session,
-     event_id: int) -> Tuple[List[List[str]], List[int]]:
+     event_id: int) -> Tuple[np.ndarray, List[int]]:
     """
     Generate an encounter matrix for a given event.
 
@@ -28,7 +43,7 @@ def generate_encounter_matrix(
     event.
     The matrix is of size len_participant*len_participant, where
     len_participant is the number of users that joined the
-    event.
+    event. Its cells are int8 values of EncounterCode.
 
     Parameters
     ----------
@@ -39,7 +54,7 @@ def generate_encounter_matrix(
 
     Returns
     -------
-    Tuple[List[List[str]], List[int]]
+    Tuple[np.ndarray, List[int]]
         The encounter matrix and a list mapping matrix indices to user IDs.
     """
 
@@ -53,43 +68,46 @@ def generate_encounter_matrix(
 
     # Initialize an len_participant x len_participant matrix filled with
     # "NO_INTERACTION"
-    matrix = [
-        [
-            "NO_INTERACTION" for _ in range(len_participant)
-            ] for _ in range(len_participant)
-        ]
+    matrix = np.zeros((len_participant, len_participant), dtype=np.int8)
 
     # Initialize a list to map matrix indices to user IDs
-    id_to_user = [participant.id for participant in participants]
-
-    # Fill the off-diagonal cells based on friendships
-    for i in range(len_participant):
-        for j in range(i+1, len_participant):
-            user1 = participants[i]
-            user2 = participants[j]
-
-            try:
-                friendship = friendship_service.read_friendship(
-                    user1.id,
-                    user2.id)
-                status = friendship.status
-
-                if status == FriendshipStatus.PENDING:
-                    matrix[i][j] = "FR_SEND"
-                    matrix[j][i] = "FR_IGNORED"
-                elif status == FriendshipStatus.ACCEPTED:
-                    matrix[i][j] = "FR_SEND"
-                    matrix[j][i] = "FR_ACCEPTED"
-                elif status == FriendshipStatus.DENIED:
-                    matrix[i][j] = "FR_SEND"
-                    matrix[j][i] = "FR_REFUSED"
-                elif status == FriendshipStatus.REPORT:
-                    matrix[i][j] = "USER_REPORT"
-                    matrix[j][i] = "USER_REPORTED"
-
-            except HTTPException:
-                # If no friendship record exists, the matrix value remains
-                # "NO_INTERACTION"
-                pass
+    id_to_user = [participant["id"] for participant in participants]
+
+    # Read all friendships between participants at once, and keep those whose
+    # sender comes before the receiver in the matrix, as (row, column) pairs
+    index_of_user = {user: index for index, user in enumerate(id_to_user)}
+    rows, columns, sender_codes, receiver_codes = [], [], [], []
+    for friendship in friendship_service.read_friendships_among(id_to_user):
+        i = index_of_user[friendship.invite_sender_id]
+        j = index_of_user[friendship.invite_receiver_id]
+        if i < j:
+            rows.append(i)
+            columns.append(j)
+            sender_code, receiver_code = _STATUS_CODES[friendship.status]
+            sender_codes.append(sender_code)
+            receiver_codes.append(receiver_code)
+
+    # Fill the off-diagonal cells based on friendships in one assignment per
+    # side. If no friendship record exists, the matrix value remains
+    # "NO_INTERACTION"
+    matrix[rows, columns] = sender_codes
+    matrix[columns, rows] = receiver_codes
 
     return matrix, id_to_user
+
+
+def decode_encounter_matrix(matrix: np.ndarray) -> List[List[str]]:
+    """Convert an encounter matrix of codes to their names.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        The encounter matrix, as returned by generate_encounter_matrix().
+
+    Returns
+    -------
+    List[List[str]]
+        The matrix with the name of each code, e.g. "FR_SEND".
+    """
+    return [[EncounterCode(code).name for code in row]
+            for row in matrix.tolist()]
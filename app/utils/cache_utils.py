@@ -0,0 +1,127 @@
+"""This module implements a small in-process cache for read-heavy endpoints.
+
+Entries expire after a fixed delay, so that data written by another worker
+process is never served stale for longer than that delay. Writes made in this
+process invalidate the matching entries right away.
+
+Classes
+-------
+TTLCache
+    Thread-safe mapping whose entries expire after a delay.
+
+Attributes
+----------
+event_cache : TTLCache
+    Events read with approximate coordinates, keyed by event id.
+participants_cache : TTLCache
+    Participants of events as UserRead fields, keyed by event id.
+area_events_cache : TTLCache
+    Events to come around coordinates, keyed by rounded coordinates, radius
+    and category.
+friends_cache : TTLCache
+    Friends of users as UserRead fields, keyed by user id.
+geocode_cache : TTLCache
+    Coordinates of addresses from Google Maps, keyed by normalized address.
+"""
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import (Any, Dict, Generic, Hashable, List, Optional, Tuple,
+                    TypeVar)
+
+from app.models.reading_models import EventReadWithLatLon
+
+_V = TypeVar("_V")
+
+
+class TTLCache(Generic[_V]):
+    """Thread-safe mapping whose entries expire after a delay.
+
+    When full, the oldest entry is evicted to make room for a new one.
+
+    Attributes
+    ----------
+    ttl : float
+        The number of seconds an entry stays valid.
+    maxsize : int
+        The maximum number of entries kept.
+
+    Methods
+    -------
+    get(self, key)
+        Get the value stored for a key, None if missing or expired.
+    set(self, key, value)
+        Store a value for a key.
+    invalidate(self, key)
+        Remove the value stored for a key.
+    clear(self)
+        Remove all values.
+    """
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Tuple[float, _V]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[_V]:
+        """Get the value stored for a key.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to look for.
+
+        Returns
+        -------
+        Optional[_V]
+            The stored value, None if there is none or it expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] < monotonic():
+                del self._data[key]
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: _V) -> None:
+        """Store a value for a key, replacing any previous one.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key to store the value under.
+        value : _V
+            The value to store.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                self._data.popitem(last=False)
+            self._data[key] = (monotonic() + self.ttl, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove the value stored for a key, if any.
+
+        Parameters
+        ----------
+        key : Hashable
+            The key whose value to remove.
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all stored values."""
+        with self._lock:
+            self._data.clear()
+
+
+event_cache: TTLCache[EventReadWithLatLon] = TTLCache(ttl=30)
+participants_cache: TTLCache[List[Dict[str, Any]]] = TTLCache(ttl=10)
+area_events_cache: TTLCache[List[Dict[str, Any]]] = TTLCache(ttl=30)
+friends_cache: TTLCache[List[Dict[str, Any]]] = TTLCache(ttl=30)
+# Google Maps terms allow caching geocoding results for up to 30 days.
+geocode_cache: TTLCache[Tuple[float, float]] = TTLCache(ttl=2 * 24 * 3600,
+                                                        maxsize=4096)
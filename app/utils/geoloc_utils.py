@@ -6,25 +6,64 @@ get_latlon_from_address(address)
     Get the coordinates from the address.
 get_random_latlon(latlon):
     Create a random latlon nearby
+get_random_latlon_arrays(lats, lons):
+    Create random coordinates nearby each coordinate of arrays.
+is_within_radius_batch(center, lats, lons, radius)
+    Check which coordinates of arrays are within radius of a center.
+get_bounding_box(center, radius)
+    Get the latitude and longitude bounds of a circle around a center.
 """
+from functools import lru_cache
 import math
 import random
+from typing import Tuple
 
-from geopy import distance
+from fastapi import HTTPException
 from googlemaps import Client
+import numpy as np
+from requests import Session
+from requests.adapters import HTTPAdapter
 
-from app.configs.settings import ExtResourcesSettings
+from app.configs.settings import get_ext_resources_settings
 from app.models.addresses import AddressCreate
 from app.models.latitudes_longitudes import LatLon
+from app.utils.cache_utils import geocode_cache
 
-gmaps = Client(key=ExtResourcesSettings().gmaps_key)
 RADIUS_METERS = 100
+EARTH_RADIUS_METERS = 6371008.8
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_METERS / 180
+
+_RADIUS_DEGREES = RADIUS_METERS / METERS_PER_DEGREE
+_TAU = 2 * math.pi
+
+_rng = np.random.default_rng()
+
+
+@lru_cache(maxsize=1)
+def _gmaps() -> Client:
+    """Get the Google Maps client, created on first use.
+
+    Endpoints run in a thread pool, so the client keeps enough connections
+    alive to the API for concurrent geocoding requests not to open new TLS
+    connections.
+
+    Returns
+    -------
+    Client
+        The Google Maps client.
+    """
+    session = Session()
+    session.mount("https://", HTTPAdapter(pool_connections=20,
+                                          pool_maxsize=50))
+    return Client(key=get_ext_resources_settings().gmaps_key,
+                  requests_session=session)
 
 
 def get_latlon_from_address(address: AddressCreate) -> LatLon:
     """Get the coordinates of a place using its address.
 
-    This uses the Google Maps API
+    This uses the Google Maps API, whose answers are cached for a while by
+    normalized address, as venues are often reused by several events.
 
     Parameters
     ----------
@@ -35,25 +74,66 @@ def get_latlon_from_address(address: AddressCreate) -> LatLon:
     -------
     LatLon
         The latitude-longitude coordinates of the place.
+
+    Raises
+    ------
+    HTTPException(404)
+        Raised when Google Maps does not find the address.
     """
-    temp_coords = gmaps.geocode(f"{address.num} {address.street}," +
-                                f"{address.city}, {address.zipcode}")
-    coordinates = temp_coords[0]['geometry']['location']
-    return LatLon(lat=coordinates['lat'],
-                  lon=coordinates['lng'])
+    cache_key = _normalize_address(address)
+    coordinates = geocode_cache.get(cache_key)
+    if coordinates is None:
+        coordinates = _geocode(
+            f"{address.num} {address.street}, {address.city}, "
+            f"{address.zipcode}")
+        geocode_cache.set(cache_key, coordinates)
+    return LatLon(lat=coordinates[0], lon=coordinates[1])
+
+
+def _normalize_address(address: AddressCreate) -> str:
+    """Lowercase an address and collapse its whitespace, to use as a key."""
+    return "|".join(" ".join(str(part).lower().split())
+                    for part in (address.num, address.street,
+                                 address.city, address.zipcode))
+
+
+def _geocode(address: str) -> Tuple[float, float]:
+    """Get the coordinates of an address from Google Maps.
+
+    Parameters
+    ----------
+    address : str
+        The address, as sent to the API.
+
+    Returns
+    -------
+    Tuple[float, float]
+        The latitude and longitude of the address.
+
+    Raises
+    ------
+    HTTPException(404)
+        Raised when Google Maps does not find the address.
+    """
+    places = _gmaps().geocode(address)
+    location = (places[0].get("geometry", {}).get("location")
+                if places else None)
+    if not location:
+        raise HTTPException(status_code=404,
+                            detail=f"Address {address} not found.")
+    return location["lat"], location["lng"]
 
 
 def get_random_latlon(latlon: LatLon) -> LatLon:
     """Create random latlon coordinates.
 
     We create random coordinates within the radius around the given latlon.
+    The given latlon is left untouched.
 
     Parameters
     ----------
     latlon : LatLon
         The coordinates around which to create random ones.
-    radius : int
-        The radius within which to create the random coordinates.
 
     Returns
     -------
@@ -61,46 +141,120 @@ def get_random_latlon(latlon: LatLon) -> LatLon:
         The randomly generated coordinates.
     """
     # Generate random radius and theta to use for polar coordinates
-    random_u = random.uniform(0, 1)
-    random_v = random.uniform(0, 1)
-    radius_degrees = RADIUS_METERS/1113000
-    radius = radius_degrees * math.sqrt(random_u)
-    theta = 2 * math.pi * random_v
+    radius = _RADIUS_DEGREES * math.sqrt(random.random())
+    theta = _TAU * random.random()
 
-    # Create the actual coordinates within the radius
+    # Create the actual coordinates within the radius, taking into account
+    # the shrinking of the east-west distances
     small_lat = radius * math.cos(theta)
-    small_lon = radius * math.sin(theta)
+    small_lon = radius * math.sin(theta) / math.cos(math.radians(latlon.lat))
 
-    # Take into account the shrinking of the east-west distances
-    small_lat = small_lat / math.cos(latlon.lon)
+    return LatLon(lat=latlon.lat + small_lat, lon=latlon.lon + small_lon)
 
-    # Add those small vector to current coordinates
-    latlon.lat += small_lat
-    latlon.lon += small_lon
 
-    return latlon
+def get_random_latlon_arrays(lats: np.ndarray,
+                             lons: np.ndarray
+                             ) -> Tuple[np.ndarray, np.ndarray]:
+    """Create random coordinates nearby each coordinate of arrays.
 
+    This applies the same transformation as get_random_latlon() to whole
+    arrays of latitudes and longitudes.
 
-def is_within_radius(latlon1: LatLon, latlon2: LatLon, radius: int) -> bool:
-    """Check wether the coordinates are within radius distance of each other.
+    Parameters
+    ----------
+    lats : np.ndarray
+        The latitudes around which to create random ones.
+    lons : np.ndarray
+        The longitudes around which to create random ones.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The random latitudes and longitudes, in the same order.
+    """
+    # Generate random radius and theta to use for polar coordinates
+    random_u, random_v = _rng.random((2, len(lats)))
+    radius = _RADIUS_DEGREES * np.sqrt(random_u)
+    theta = _TAU * random_v
+
+    # Same offsets as get_random_latlon(), computed for all rows at once
+    new_lats = lats + radius * np.cos(theta)
+    new_lons = lons + radius * np.sin(theta) / np.cos(np.radians(lats))
+    return new_lats, new_lons
+
+
+def is_within_radius_batch(center: LatLon,
+                           lats: np.ndarray,
+                           lons: np.ndarray,
+                           radius: int) -> np.ndarray:
+    """Check which coordinates are within radius distance of a center.
+
+    Distances are great-circle distances computed with the haversine formula
+    over whole arrays, so that many candidates are checked in one call.
 
     Parameters
     ----------
-    latlon1 : LatLon
-        The first set of coordinates.
-    latlon2 : LatLon
-        The second set of coordinates.
+    center : LatLon
+        The coordinates around which to check.
+    lats : np.ndarray
+        The latitudes of the coordinates to check, in degrees.
+    lons : np.ndarray
+        The longitudes of the coordinates to check, in degrees.
     radius : int
         The distance -in meters- to check for.
 
     Returns
     -------
-    bool
-        True if the coordinates are closer than radius, False otherwise.
+    np.ndarray
+        Boolean mask, True where the coordinates are closer than radius.
+    """
+    lat0 = math.radians(center.lat)
+    lon0 = math.radians(center.lon)
+    lats = np.radians(lats)
+    half_dlat = (lats - lat0) / 2
+    half_dlon = (np.radians(lons) - lon0) / 2
+    hav = (np.sin(half_dlat) ** 2
+           + math.cos(lat0) * np.cos(lats) * np.sin(half_dlon) ** 2)
+    meters_dist = 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(hav))
+    mask: np.ndarray = meters_dist <= radius
+    return mask
+
+
+def get_bounding_box(center: LatLon,
+                     radius: int) -> Tuple[float, float, float, float]:
+    """Get the latitude and longitude bounds of a circle around a center.
+
+    Every point within radius of the center lies inside the box, so it can be
+    used as a cheap prefilter before is_within_radius_batch(). When the circle
+    reaches a pole or crosses the antimeridian, longitudes are not bounded.
+
+    Parameters
+    ----------
+    center : LatLon
+        The center of the circle.
+    radius : int
+        The radius of the circle, in meters.
+
+    Returns
+    -------
+    Tuple[float, float, float, float]
+        The minimum latitude, maximum latitude, minimum longitude and
+        maximum longitude of the box, in degrees.
     """
-    coords1 = (latlon1.lat, latlon1.lon)
-    coords2 = (latlon2.lat, latlon2.lon)
-    meters_dist = distance.distance(coords1, coords2).meters
-    if meters_dist <= radius:
-        return True
-    return False
+    delta_lat = radius / METERS_PER_DEGREE
+    lat_min = max(center.lat - delta_lat, -90.0)
+    lat_max = min(center.lat + delta_lat, 90.0)
+    if lat_min <= -90.0 or lat_max >= 90.0:
+        return lat_min, lat_max, -180.0, 180.0
+    # The widest longitude of the circle is not at the latitude of the
+    # center: sin(delta_lon) = sin(angular radius) / cos(center latitude)
+    sin_delta_lon = (math.sin(radius / EARTH_RADIUS_METERS)
+                     / math.cos(math.radians(center.lat)))
+    if sin_delta_lon >= 1.0:
+        return lat_min, lat_max, -180.0, 180.0
+    delta_lon = math.degrees(math.asin(sin_delta_lon))
+    lon_min = center.lon - delta_lon
+    lon_max = center.lon + delta_lon
+    if lon_min < -180.0 or lon_max > 180.0:
+        return lat_min, lat_max, -180.0, 180.0
+    return lat_min, lat_max, lon_min, lon_max
@@ -4,12 +4,18 @@ Functions
 ---------
 create_picture_name(picture)
     Create a random identifier name for picture files to be saved under.
+save_picture(picture, path)
+    Write an uploaded picture to disk and close it.
 """
-from uuid import uuid4
+import os
+import secrets
+import shutil
 
 from fastapi import HTTPException, UploadFile
 
-ALLOWED_EXTENSIONS = ["png", "jpg", 'jpeg', 'JPG']
+ALLOWED_EXTENSIONS = frozenset({"png", "jpg", "jpeg"})
+ALLOWED_CONTENT_TYPES = frozenset({"image/png", "image/jpeg"})
+COPY_BUFFER_SIZE = 1024 * 1024
 
 
 def create_picture_name(picture: UploadFile) -> str:
@@ -30,15 +36,47 @@ def create_picture_name(picture: UploadFile) -> str:
     HTTPException(422)
         Raised when the picture does not contain a string filename.
     HTTPException(415)
-        Raised when the picture does not have an allowed extension.
+        Raised when the picture does not have an allowed content type or
+        extension.
     """
+    if picture.content_type not in ALLOWED_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Content type {picture.content_type} not allowed.")
     if picture.filename is None:
         raise HTTPException(status_code=422,
                             detail="Cannot process image without extension.")
-    extension = picture.filename.split(".")[1]
+    extension = os.path.splitext(picture.filename)[1][1:].lower()
     if extension not in ALLOWED_EXTENSIONS:
         raise HTTPException(status_code=415,
                             detail=f"File type .{extension} not allowed.")
 
-    token_name = uuid4().hex + "." + extension
-    return token_name
+    return f"{secrets.token_hex(16)}.{extension}"
+
+
+def save_picture(picture: UploadFile, path: str) -> None:
+    """Write an uploaded picture to disk and close it.
+
+    The picture is copied by chunks of COPY_BUFFER_SIZE bytes, much larger
+    than the shutil default, to keep the number of system calls low. It is
+    written to a temporary file first and then moved in place, so that a
+    failed upload never leaves a truncated picture behind.
+
+    Parameters
+    ----------
+    picture : UploadFile
+        The picture to save.
+    path : str
+        The path of the file to write the picture to.
+    """
+    temp_path = f"{path}.part"
+    try:
+        with open(temp_path, "wb") as buffer:
+            shutil.copyfileobj(picture.file, buffer, COPY_BUFFER_SIZE)
+        os.replace(temp_path, path)
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    finally:
+        picture.file.close()
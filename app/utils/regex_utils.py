@@ -3,8 +3,17 @@
 # Allowed letters to use in simple strings through the app.
 ALLOWED = r"a-zA-Z\u00C0-\u00D6\u00D8-\u00F6"
 
-# Regular expression used to validate the names of Users.
-NAME_REGEX = fr"^([{ALLOWED}]+([ \-']{{0,1}}[{ALLOWED}]+)*){{1,2}}$"
+# Letters allowed in the names of cities.
+CITY_ALLOWED = r"a-zA-Z\u0080-\u024F"
 
-# Regular expression used to validate the names of cities
-CITY_REGEX = r"^([a-zA-Z\u0080-\u024F]+(?:. |-| |'))*[a-zA-Z\u0080-\u024F]*$"
+# Regular expression used to validate the names of Users: words separated by
+# a single space, hyphen or apostrophe. Each word must be followed by a
+# separator to repeat, so a name can only be split one way and matching time
+# stays linear even on inputs that fail.
+NAME_REGEX = fr"^[{ALLOWED}]+(?:[ \-'][{ALLOWED}]+)*$"
+
+# Regular expression used to validate the names of cities: words, each ended
+# by a hyphen, an apostrophe, a space, or any other character then a space.
+# That character is never a letter, so matching time stays linear.
+CITY_REGEX = (fr"^(?:[{CITY_ALLOWED}]+(?:[^{CITY_ALLOWED}\n] |[ \-']))*"
+              fr"[{CITY_ALLOWED}]*$")
@@ -1,13 +1,49 @@
 """Functions related to authentication by token"""
-from datetime import datetime, timedelta
+import base64
+from datetime import timedelta
+import hashlib
+import hmac
+import time
 from typing import Any, Optional
 
-from jose import jwt, JWTError
+import jwt
+import orjson
 
-from app.configs.settings import AuthSettings
+from app.configs.settings import get_auth_settings
 
-SECRET_KEY = AuthSettings().key
-ALGORITHM = AuthSettings().algo
+SECRET_KEY = get_auth_settings().key
+ALGORITHM = get_auth_settings().algo
+_DEFAULT_EXP_SECONDS = 15 * 60
+
+
+def _b64url(raw: bytes) -> bytes:
+    """Encode bytes in unpadded base64url, as required by JWT."""
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+
+# The token header is constant and the HMAC key schedule only depends on the
+# secret, so both are computed once for the default HS256 algorithm.
+_HS256_HEADER = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+_HS256_SIGNER = hmac.new(SECRET_KEY.encode(), digestmod=hashlib.sha256)
+
+
+def _encode_hs256(claims: dict[str, Any]) -> str:
+    """Encode and sign claims as a HS256 JWT.
+
+    Parameters
+    ----------
+    claims : dict[str, Any]
+        JSON serializable claims to encode in the token.
+
+    Returns
+    -------
+    str
+        The token.
+    """
+    signing_input = _HS256_HEADER + b"." + _b64url(orjson.dumps(claims))
+    signer = _HS256_SIGNER.copy()
+    signer.update(signing_input)
+    return (signing_input + b"." + _b64url(signer.digest())).decode()
 
 
 def create_access_token(data: dict[str, Any],
@@ -19,27 +55,19 @@ def create_access_token(data: dict[str, Any],
     data : dict[str, Any]
         Data to encode in the token.
     expires_delta : Optional[timedelta], optional
-        The time before the token exprires, in minutes, by default None
+        The time before the token exprires, by default None for 15 minutes
 
     Returns
     -------
     str
         The token
-
-    Raises
-    ------
-    JWTError
-        Raised when jwt failed to encore the token as a str.
     """
-    to_encode = data.copy()
-
     if expires_delta:
-        expire = datetime.utcnow() + expires_delta
+        lifetime = int(expires_delta.total_seconds())
     else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
+        lifetime = _DEFAULT_EXP_SECONDS
+    to_encode = {**data, "exp": int(time.time()) + lifetime}
 
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    if not isinstance(encoded_jwt, str):
-        raise JWTError
-    return encoded_jwt
+    if ALGORITHM == "HS256":
+        return _encode_hs256(to_encode)
+    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
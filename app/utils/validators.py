@@ -1,12 +1,55 @@
 """This module contains validators used through several models in the app.
 
+Classes
+-------
+FirstNameStr(ConstrainedStr)
+    Constrained string type for the first names of users.
+LastNameStr(ConstrainedStr)
+    Constrained string type for the last names of users.
+CityStr(ConstrainedStr)
+    Constrained string type for city names.
+
 Functions
 ---------
 check_valid_phone(value)
     Verify that the input value is a valid phone number.
 """
+from functools import lru_cache
+import re
+
 from fastapi import HTTPException
 import phonenumbers as pn
+from pydantic import ConstrainedStr
+
+from app.utils.regex_utils import CITY_REGEX, NAME_REGEX
+
+# French mobile numbers in E.164 format. The national part is the mobile
+# pattern of the phonenumbers metadata for FR, so that this accepts only
+# numbers that phonenumbers also finds valid.
+_FRENCH_MOBILE = re.compile(
+    r"\+33(?:6(?:[0-24-8]\d|3[0-8]|9[589])|7[3-9]\d)\d{6}")
+
+
+class FirstNameStr(ConstrainedStr):
+    """First name of a user: maximum 20 characters, matching NAME_REGEX.
+
+    The pattern is compiled once here and shared by every model using this
+    type, instead of being rebuilt for each field declaration.
+    """
+    max_length = 20
+    regex = re.compile(NAME_REGEX)
+
+
+class LastNameStr(ConstrainedStr):
+    """Last name of a user: maximum 40 characters, matching NAME_REGEX."""
+    max_length = 40
+    regex = FirstNameStr.regex
+
+
+class CityStr(ConstrainedStr):
+    """Name of a city: maximum 50 characters, matching CITY_REGEX."""
+    max_length = 50
+    regex = re.compile(CITY_REGEX)
 
 
 def check_valid_phone(value: str) -> str:
@@ -27,14 +70,21 @@ def check_valid_phone(value: str) -> str:
     HTTPException
         Raised when the string is not a valid phone number
     """
+    # Most users have a French mobile, checked without parsing the number
+    if _FRENCH_MOBILE.fullmatch(value) or _is_valid_phone(value):
+        return value
     # TODO Might wanna use a custom exception instead.
-    invalid_exc = HTTPException(
-        status_code=422,
-        detail=f"{value} is not a valid phone number.")
+    raise HTTPException(status_code=422,
+                        detail=f"{value} is not a valid phone number.")
+
+
+@lru_cache(maxsize=4096)
+def _is_valid_phone(value: str) -> bool:
+    """Check a phone number against the phonenumbers metadata, cached.
+
+    Users keep sending the same numbers, so each one is only parsed once.
+    """
     try:
-        phone = pn.parse(value)
-        if pn.is_valid_number(phone):
-            return value
-        raise invalid_exc
-    except pn.NumberParseException as exc:
-        raise invalid_exc from exc
+        return bool(pn.is_valid_number(pn.parse(value)))
+    except pn.NumberParseException:
+        return False
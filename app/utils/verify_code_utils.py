@@ -8,12 +8,34 @@ send_verify_code()
     Send the verification code to the user.
 check_verify_code(phone_number)
     check if the verification code provided by the user is correct
+close_verify_client()
+    Close the connections of the Twilio client, if it was created.
 """
+from functools import lru_cache
+
+from twilio.http.async_http_client import AsyncTwilioHttpClient
 from twilio.rest import Client
-from app.configs.settings import ExtResourcesSettings
+from app.configs.settings import get_ext_resources_settings
+
 
-client = Client(ExtResourcesSettings().account_sid,
-                ExtResourcesSettings().auth_token)
+@lru_cache(maxsize=1)
+def _client() -> Client:
+    """Get the Twilio client, created on first use.
+
+    The client sends requests asynchronously through a single pooled HTTP
+    session, so that waiting for Twilio does not hold a worker thread. That
+    session binds to the running event loop, hence it is only created from a
+    coroutine.
+
+    Returns
+    -------
+    Client
+        The Twilio client.
+    """
+    settings = get_ext_resources_settings()
+    return Client(settings.account_sid,
+                  settings.auth_token,
+                  http_client=AsyncTwilioHttpClient())
 
 
 def create_verify_code() -> str:
@@ -27,7 +49,7 @@ def create_verify_code() -> str:
     return "1941"
 
 
-def send_verify_code(phone_number: str) -> str:
+async def send_verify_code(phone_number: str) -> str:
     """Send an SMS message.
 
     Parameters
@@ -43,16 +65,17 @@ def send_verify_code(phone_number: str) -> str:
             The status of the verification.
     """
 
-    verification = client.verify \
-        .services(ExtResourcesSettings().service_sid) \
+    verification = await _client().verify \
+        .v2 \
+        .services(get_ext_resources_settings().service_sid) \
         .verifications \
-        .create(to=phone_number, channel='sms')
+        .create_async(to=phone_number, channel='sms')
     if isinstance(verification.status, str):
         return verification.status
     raise TypeError("Twilio verification status should be a string.")
 
 
-def check_verify_code(phone_number: str, code: str) -> str:
+async def check_verify_code(phone_number: str, code: str) -> str:
     """Check the SMS code.
 
     Args:
@@ -65,10 +88,18 @@ def check_verify_code(phone_number: str, code: str) -> str:
         verification_check.status : str
             The status of the verification check.
     """
-    verification_check = client.verify \
-        .services(ExtResourcesSettings().service_sid) \
+    verification_check = await _client().verify \
+        .v2 \
+        .services(get_ext_resources_settings().service_sid) \
         .verification_checks \
-        .create(to=phone_number, code=code)
+        .create_async(to=phone_number, code=code)
     if isinstance(verification_check.status, str):
         return verification_check.status
     raise TypeError("Twilio verification status should be a string.")
+
+
+async def close_verify_client() -> None:
+    """Close the connections of the Twilio client, if it was created."""
+    if _client.cache_info().currsize:
+        await _client().http_client.close()
+        _client.cache_clear()
@@ -0,0 +1,33 @@
+"""Manually check the SMS verification flow against Twilio.
+
+Twilio credentials are read from the app settings, like in the API. Run from
+the repository root:
+
+    python -m scripts.manual_sms_test +33612345678
+"""
+import asyncio
+import sys
+
+from app.utils.verify_code_utils import (check_verify_code,
+                                         close_verify_client,
+                                         send_verify_code)
+
+
+async def main(phone: str) -> None:
+    """Send a verification code to a phone and check the one typed back.
+
+    Parameters
+    ----------
+    phone : str
+        The phone number to send the verification code to.
+    """
+    print(await send_verify_code(phone))
+    otp_code = input("Enter OTP: ")
+    print(await check_verify_code(phone, otp_code))
+    await close_verify_client()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        sys.exit("Usage: python -m scripts.manual_sms_test <phone>")
+    asyncio.run(main(sys.argv[1]))
@@ -1,4 +1,6 @@
 """This module implements all pytest fixtures."""
+from datetime import datetime, timedelta
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine
@@ -6,6 +8,13 @@ from sqlmodel.pool import StaticPool
 
 from app.configs.api_dependencies import get_session
 from app.configs.api_setup import app
+from app.models.enums import EventCategory, UserEventStatus
+from app.models.events import Event
+from app.models.links import UserEventLink
+from app.models.users import User
+from app.utils.cache_utils import (area_events_cache, event_cache,
+                                   friends_cache, geocode_cache,
+                                   participants_cache)
 
 
 @pytest.fixture(name="session")
@@ -17,7 +26,8 @@ def session_fixture():
         poolclass=StaticPool
     )
     SQLModel.metadata.create_all(engine)
-    with Session(engine) as session:
+    # Same as the app's session_factory: objects stay loaded after commit
+    with Session(engine, expire_on_commit=False) as session:
         yield session
 
 
@@ -31,3 +41,36 @@ def client_fixture(session: Session):
     client = TestClient(app)
     yield client
     app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Start each test with empty caches, as ids are reused between tests."""
+    for cache in (area_events_cache, event_cache, friends_cache,
+                  geocode_cache, participants_cache):
+        cache.clear()
+
+
+@pytest.fixture(name="event_links")
+def event_links_fixture(session: Session):
+    """Provide an event with its creator, a pending user and a stranger."""
+    creator = User(phone="+33600000001", first_name="Jane", last_name="Doe")
+    pending = User(phone="+33600000002", first_name="John", last_name="Doe")
+    stranger = User(phone="+33600000003", first_name="Jim", last_name="Doe")
+    start_time = datetime.now() + timedelta(days=1)
+    event = Event(name="Party",
+                  desc="A party.",
+                  category=EventCategory.PARTY,
+                  start_time=start_time,
+                  end_time=start_time + timedelta(hours=2),
+                  capacity=10)
+    session.add_all([creator, pending, stranger, event])
+    session.commit()
+    session.add_all([UserEventLink(user_id=creator.id,
+                                   event_id=event.id,
+                                   status=UserEventStatus.CREATOR),
+                     UserEventLink(user_id=pending.id,
+                                   event_id=event.id,
+                                   status=UserEventStatus.PENDING)])
+    session.commit()
+    return creator.id, pending.id, stranger.id, event.id
@@ -0,0 +1,68 @@
+"""Tests of the event reads with strict loading."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import joinedload, raiseload
+from sqlmodel import Session
+
+from app.dao import event_dao
+from app.dao.event_dao import EventDao
+from app.models.enums import EventCategory
+from app.models.events import Event
+from app.models.latitudes_longitudes import LatLon
+
+
+@pytest.fixture(autouse=True)
+def strict_loading(monkeypatch):
+    """Read events as with APP_STRICT_LOADING set."""
+    monkeypatch.setattr(event_dao,
+                        "EVENT_LOAD_OPTIONS",
+                        [joinedload(Event.latlon), raiseload("*")])
+
+
+@pytest.fixture(name="event_id")
+def event_id_fixture(session: Session) -> int:
+    """Provide the id of an event with coordinates, read by no session."""
+    start_time = datetime.now() + timedelta(days=1)
+    event = Event(name="Party",
+                  desc="A party.",
+                  category=EventCategory.PARTY,
+                  start_time=start_time,
+                  end_time=start_time + timedelta(hours=2),
+                  capacity=10,
+                  latlon=LatLon(lat=48.8566, lon=2.3522))
+    session.add(event)
+    session.commit()
+    event_id = event.id
+    # Reads must hit the database rather than the identity map.
+    session.expunge_all()
+    return event_id
+
+
+def _assert_strictly_loaded(event: Event) -> None:
+    assert event.latlon.lat == 48.8566
+    with pytest.raises(InvalidRequestError):
+        event.user_links
+
+
+class TestStrictLoading:
+    """Tests that event reads load what their callers use."""
+
+    def test_read_event(self, session: Session, event_id: int):
+        """A single event comes with its coordinates."""
+        _assert_strictly_loaded(EventDao(session).read_event(event_id))
+
+    def test_read_events(self, session: Session, event_id: int):
+        """A page of events comes with their coordinates."""
+        events = EventDao(session).read_events(0, 10)
+
+        assert [event.id for event in events] == [event_id]
+        _assert_strictly_loaded(events[0])
+
+    def test_read_all_events(self, session: Session, event_id: int):
+        """All events come with their coordinates."""
+        events = EventDao(session).read_all_events()
+
+        assert [event.id for event in events] == [event_id]
+        _assert_strictly_loaded(events[0])
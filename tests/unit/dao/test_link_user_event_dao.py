@@ -0,0 +1,91 @@
+"""Tests of the status updates made by an event creator."""
+from sqlmodel import Session
+
+from app.dao.link_user_event_dao import UserEventLinkDao
+from app.models.enums import UserEventStatus
+from app.models.links import UserEventLink
+
+
+def _read_status(session: Session,
+                 user_id: int,
+                 event_id: int) -> UserEventStatus:
+    return session.get(UserEventLink, (user_id, event_id)).status
+
+
+class TestUpdateStatusAsCreator:
+    """Tests of UserEventLinkDao.update_status_as_creator."""
+
+    def test_creator_updates_link(self, session: Session, event_links):
+        """The creator of the event can change the status of a link."""
+        creator_id, pending_id, _, event_id = event_links
+
+        updated = (UserEventLinkDao(session)
+                   .update_status_as_creator(creator_id,
+                                             event_id,
+                                             pending_id,
+                                             UserEventStatus.PENDING,
+                                             UserEventStatus.ATTENDS))
+
+        assert updated
+        assert (_read_status(session, pending_id, event_id)
+                == UserEventStatus.ATTENDS)
+
+    def test_loaded_link_sees_update(self, session: Session, event_links):
+        """A link already loaded in the session is not left stale."""
+        creator_id, pending_id, _, event_id = event_links
+        link = session.get(UserEventLink, (pending_id, event_id))
+
+        (UserEventLinkDao(session)
+         .update_status_as_creator(creator_id,
+                                   event_id,
+                                   pending_id,
+                                   UserEventStatus.PENDING,
+                                   UserEventStatus.ATTENDS))
+
+        assert link.status == UserEventStatus.ATTENDS
+
+    def test_non_creator_cannot_update_link(self,
+                                            session: Session,
+                                            event_links):
+        """A user that did not create the event cannot change a link."""
+        _, pending_id, stranger_id, event_id = event_links
+
+        updated = (UserEventLinkDao(session)
+                   .update_status_as_creator(stranger_id,
+                                             event_id,
+                                             pending_id,
+                                             UserEventStatus.PENDING,
+                                             UserEventStatus.ATTENDS))
+
+        assert not updated
+        assert (_read_status(session, pending_id, event_id)
+                == UserEventStatus.PENDING)
+
+    def test_wrong_old_status(self, session: Session, event_links):
+        """A link that doesn't have the expected status is left as is."""
+        creator_id, pending_id, _, event_id = event_links
+
+        updated = (UserEventLinkDao(session)
+                   .update_status_as_creator(creator_id,
+                                             event_id,
+                                             pending_id,
+                                             UserEventStatus.ATTENDS,
+                                             UserEventStatus.DELETED))
+
+        assert not updated
+        assert (_read_status(session, pending_id, event_id)
+                == UserEventStatus.PENDING)
+
+    def test_missing_link(self, session: Session, event_links):
+        """Nothing is updated when the user has no link to the event."""
+        creator_id, _, stranger_id, event_id = event_links
+
+        updated = (UserEventLinkDao(session)
+                   .update_status_as_creator(creator_id,
+                                             event_id,
+                                             stranger_id,
+                                             UserEventStatus.PENDING,
+                                             UserEventStatus.ATTENDS))
+
+        assert not updated
+        assert session.get(UserEventLink, (stranger_id, event_id)) is None
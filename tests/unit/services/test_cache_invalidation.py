@@ -0,0 +1,119 @@
+"""Tests that writes drop the cached reads they make stale."""
+from datetime import date, datetime, timedelta
+
+from sqlmodel import Session
+
+from app.models.enums import EventCategory, FriendshipStatus
+from app.models.events import Event, EventUpdate
+from app.models.latitudes_longitudes import LatLon, LatLonRead
+from app.models.links import Friendship
+from app.models.users import User, UserUpdate
+from app.services.event_services import EventService
+from app.services.friendship_services import FriendshipService
+from app.services.user_services import UserService
+from app.utils.cache_utils import area_events_cache, friends_cache
+
+
+def _create_friends(session: Session) -> tuple:
+    """Create two users that are friends and return their ids."""
+    sender = User(phone="+33600000001", first_name="Jane", last_name="Doe")
+    receiver = User(phone="+33600000002", first_name="John", last_name="Doe")
+    session.add_all([sender, receiver])
+    session.commit()
+    session.add(Friendship(invite_sender_id=sender.id,
+                           invite_receiver_id=receiver.id,
+                           date=date.today(),
+                           status=FriendshipStatus.ACCEPTED))
+    session.commit()
+    return sender.id, receiver.id
+
+
+class TestAreaEventsCache:
+    """Tests of the invalidation of area_events_cache."""
+
+    def test_update_event_clears_area_events(self, session: Session):
+        """Updating an event drops the events cached per area."""
+        start_time = datetime.now() + timedelta(days=1)
+        event = Event(name="Party",
+                      desc="A party.",
+                      category=EventCategory.PARTY,
+                      start_time=start_time,
+                      end_time=start_time + timedelta(hours=2),
+                      capacity=10)
+        session.add(event)
+        session.commit()
+        event_service = EventService(session)
+        latlon = LatLonRead(lat=48.8566, lon=2.3522)
+        event_service.read_events_to_come_in_area(latlon, 1000, None)
+        cache_key = (48.857, 2.352, 1000, None)
+        assert area_events_cache.get(cache_key) == []
+
+        event_service.update_event(event.id, EventUpdate(name="Concert"))
+
+        assert area_events_cache.get(cache_key) is None
+
+    def test_small_radius_uses_exact_center(self, session: Session):
+        """A search under AREA_CACHE_MIN_RADIUS is centered on the exact
+        coordinates and is not cached."""
+        start_time = datetime.now() + timedelta(days=1)
+        # About 35 meters from the searched point, 85 from its rounding
+        event = Event(name="Party",
+                      desc="A party.",
+                      category=EventCategory.PARTY,
+                      start_time=start_time,
+                      end_time=start_time + timedelta(hours=2),
+                      capacity=10,
+                      latlon=LatLon(lat=48.8567, lon=2.3524))
+        session.add(event)
+        session.commit()
+        latlon = LatLonRead(lat=48.8564, lon=2.3524)
+
+        events = (EventService(session)
+                  .read_events_to_come_in_area(latlon, 50, None))
+
+        assert [found["id"] for found in events] == [event.id]
+        assert area_events_cache.get((48.856, 2.352, 50, None)) is None
+
+
+class TestFriendsCache:
+    """Tests of the invalidation of friends_cache."""
+
+    def test_read_friends_is_cached(self, session: Session):
+        """The friends of a user are cached once read."""
+        sender_id, receiver_id = _create_friends(session)
+
+        friends = UserService(session).read_friends(sender_id)
+
+        assert [friend["id"] for friend in friends] == [receiver_id]
+        assert friends_cache.get(sender_id) == friends
+
+    def test_update_user_invalidates_friends(self, session: Session):
+        """Updating a user drops the cached friends of their friends."""
+        sender_id, receiver_id = _create_friends(session)
+        user_service = UserService(session)
+        user_service.read_friends(sender_id)
+        user_service.read_friends(receiver_id)
+
+        user_service.update_user(sender_id, UserUpdate(bio="New bio."))
+
+        assert friends_cache.get(sender_id) is None
+        assert friends_cache.get(receiver_id) is None
+        friends = user_service.read_friends(receiver_id)
+        assert friends[0]["bio"] == "New bio."
+
+    def test_friendship_update_invalidates_both_users(self,
+                                                      session: Session):
+        """Changing a friendship drops the cached friends of both users."""
+        sender_id, receiver_id = _create_friends(session)
+        user_service = UserService(session)
+        user_service.read_friends(sender_id)
+        user_service.read_friends(receiver_id)
+
+        (FriendshipService(session)
+         .update_friendship_status(sender_id,
+                                   receiver_id,
+                                   FriendshipStatus.REPORT))
+
+        assert friends_cache.get(sender_id) is None
+        assert friends_cache.get(receiver_id) is None
+        assert user_service.read_friends(sender_id) == []
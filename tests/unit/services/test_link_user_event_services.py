@@ -0,0 +1,84 @@
+"""Tests of the status updates made by an event creator."""
+from sqlmodel import Session
+
+from app.models.enums import UserEventStatus
+from app.services.link_user_event_services import UserEventLinkService
+from app.utils.cache_utils import participants_cache
+
+
+class TestTransitionStatusAsCreator:
+    """Tests of UserEventLinkService.transition_status_as_creator."""
+
+    def test_returns_user_and_invalidates_participants(self,
+                                                       session: Session,
+                                                       event_links):
+        """A successful update returns the user and drops the participants
+        cached for the event."""
+        creator_id, pending_id, _, event_id = event_links
+        participants_cache.set(event_id, [])
+
+        user = (UserEventLinkService(session)
+                .transition_status_as_creator(creator_id,
+                                              event_id,
+                                              pending_id,
+                                              UserEventStatus.PENDING,
+                                              UserEventStatus.ATTENDS))
+
+        assert user is not None and user.id == pending_id
+        assert participants_cache.get(event_id) is None
+
+    def test_non_creator_returns_none(self, session: Session, event_links):
+        """A caller linked to the event without creating it gets None."""
+        _, pending_id, _, event_id = event_links
+
+        user = (UserEventLinkService(session)
+                .transition_status_as_creator(pending_id,
+                                              event_id,
+                                              pending_id,
+                                              UserEventStatus.PENDING,
+                                              UserEventStatus.ATTENDS))
+
+        assert user is None
+
+    def test_unlinked_caller_returns_none(self,
+                                          session: Session,
+                                          event_links):
+        """A caller without a link to the event gets None."""
+        _, pending_id, stranger_id, event_id = event_links
+
+        user = (UserEventLinkService(session)
+                .transition_status_as_creator(stranger_id,
+                                              event_id,
+                                              pending_id,
+                                              UserEventStatus.PENDING,
+                                              UserEventStatus.ATTENDS))
+
+        assert user is None
+
+    def test_wrong_old_status_returns_none(self,
+                                           session: Session,
+                                           event_links):
+        """A link that doesn't have the expected status gives None."""
+        creator_id, pending_id, _, event_id = event_links
+
+        user = (UserEventLinkService(session)
+                .transition_status_as_creator(creator_id,
+                                              event_id,
+                                              pending_id,
+                                              UserEventStatus.ATTENDS,
+                                              UserEventStatus.DELETED))
+
+        assert user is None
+
+    def test_missing_link_returns_none(self, session: Session, event_links):
+        """A user without a link to the event gets None."""
+        creator_id, _, stranger_id, event_id = event_links
+
+        user = (UserEventLinkService(session)
+                .transition_status_as_creator(creator_id,
+                                              event_id,
+                                              stranger_id,
+                                              UserEventStatus.PENDING,
+                                              UserEventStatus.ATTENDS))
+
+        assert user is None
@@ -0,0 +1,59 @@
+"""Tests of the geolocation helpers used by the area search."""
+import numpy as np
+import pytest
+
+from app.models.latitudes_longitudes import LatLon
+from app.utils.geoloc_utils import (EARTH_RADIUS_METERS, get_bounding_box,
+                                    is_within_radius_batch)
+
+
+def _points_around(center: LatLon, radius: int, count: int):
+    """Sample points up to radius from center, a tenth of them on the
+    circle itself, where the box is tightest."""
+    rng = np.random.default_rng(0)
+    bearings = rng.uniform(0, 2 * np.pi, count)
+    distances = radius * np.sqrt(rng.uniform(0, 1, count))
+    distances[:count // 10] = radius
+    lat0 = np.radians(center.lat)
+    angles = distances / EARTH_RADIUS_METERS
+    lats = np.arcsin(np.sin(lat0) * np.cos(angles)
+                     + np.cos(lat0) * np.sin(angles) * np.cos(bearings))
+    lons = np.radians(center.lon) + np.arctan2(
+        np.sin(bearings) * np.sin(angles) * np.cos(lat0),
+        np.cos(angles) - np.sin(lat0) * np.sin(lats))
+    return np.degrees(lats), np.degrees(lons)
+
+
+class TestBoundingBox:
+    """Tests of get_bounding_box."""
+
+    @pytest.mark.parametrize("lat, radius", [(48.85, 30_000),
+                                             (60.0, 300_000),
+                                             (70.0, 1_000_000),
+                                             (-75.0, 500_000),
+                                             (0.0, 100),
+                                             (10.0, 2_000_000)])
+    def test_box_contains_every_point_within_radius(self, lat, radius):
+        """Every point that is_within_radius_batch accepts is in the box."""
+        center = LatLon(lat=lat, lon=20.0)
+        lats, lons = _points_around(center, radius, 50_000)
+        within = is_within_radius_batch(center, lats, lons, radius)
+        lat_min, lat_max, lon_min, lon_max = get_bounding_box(center, radius)
+
+        in_box = ((lats >= lat_min) & (lats <= lat_max)
+                  & (lons >= lon_min) & (lons <= lon_max))
+
+        assert within.sum() > 0
+        assert not np.any(within & ~in_box)
+
+    def test_circle_around_a_pole_is_not_bounded_in_longitude(self):
+        """A circle reaching a pole spans every longitude."""
+        box = get_bounding_box(LatLon(lat=89.5, lon=20.0), 100_000)
+
+        assert box[2:] == (-180.0, 180.0)
+
+    def test_circle_across_antimeridian_is_not_bounded_in_longitude(self):
+        """A circle crossing the antimeridian spans every longitude."""
+        box = get_bounding_box(LatLon(lat=0.0, lon=179.9), 30_000)
+
+        assert box[2:] == (-180.0, 180.0)
@@ -0,0 +1,77 @@
+"""Tests of the regular expressions used for validation."""
+import re
+import time
+
+import pytest
+
+from app.utils.regex_utils import CITY_REGEX, NAME_REGEX
+
+# Inputs that took the former patterns seconds to minutes to reject.
+SLOW_NAME = "a" * 24 + "!"
+SLOW_CITY = "aa " * 30 + "!"
+
+
+class TestNameRegex:
+    """Tests of NAME_REGEX."""
+
+    @pytest.mark.parametrize("name", ["Jane",
+                                      "Jean-Pierre",
+                                      "O'Connor",
+                                      "Mary Ann",
+                                      "Zoé",
+                                      "Anne-Marie Dupont"])
+    def test_accepted(self, name: str):
+        """Words joined by single separators are valid names."""
+        assert re.match(NAME_REGEX, name)
+
+    @pytest.mark.parametrize("name", ["",
+                                      "J4ne",
+                                      "Jane!",
+                                      "-Jean",
+                                      "Jean ",
+                                      "Jean--Pierre",
+                                      "Jean-'Pierre",
+                                      "Mary  Ann"])
+    def test_rejected(self, name: str):
+        """Other characters, and leading, trailing or doubled separators,
+        are refused."""
+        assert not re.match(NAME_REGEX, name)
+
+    def test_rejects_in_linear_time(self):
+        """A long invalid name is rejected at once."""
+        start = time.perf_counter()
+
+        assert not re.match(NAME_REGEX, SLOW_NAME)
+        assert time.perf_counter() - start < 1
+
+
+class TestCityRegex:
+    """Tests of CITY_REGEX."""
+
+    @pytest.mark.parametrize("city", ["Paris",
+                                      "Saint-Étienne",
+                                      "L'Haÿ-les-Roses",
+                                      "New York",
+                                      "Frankfurt am Main",
+                                      "St. Louis",
+                                      "Łódź"])
+    def test_accepted(self, city: str):
+        """Words joined by separators, or by a sign and a space, are valid
+        cities."""
+        assert re.match(CITY_REGEX, city)
+
+    @pytest.mark.parametrize("city", ["Paris1",
+                                      "Paris!",
+                                      "-Paris",
+                                      "Saint--Denis",
+                                      "St.. Louis"])
+    def test_rejected(self, city: str):
+        """Other characters, and misplaced separators, are refused."""
+        assert not re.match(CITY_REGEX, city)
+
+    def test_rejects_in_linear_time(self):
+        """A long invalid city is rejected at once."""
+        start = time.perf_counter()
+
+        assert not re.match(CITY_REGEX, SLOW_CITY)
+        assert time.perf_counter() - start < 1